@@ -8,19 +8,101 @@ import sys
 import subprocess
 import platform
 import shutil
+import threading
 from pathlib import Path
 
+# PyInstaller work directory, kept between runs to reuse its analysis cache
+PYINSTALLER_CACHE = ".pyinstaller-cache"
+
+# Bytes of stderr kept from a streamed command for the failure message
+STDERR_TAIL_SIZE = 4096
+
 def run_command(command, description):
     """Run a command and handle errors"""
     print(f"\n🔄 {description}...")
+    sys.stdout.flush()
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        # command is an argv list, run without a shell; stdout goes straight
+        # to our terminal, stderr is echoed as it arrives and only its tail
+        # is kept for error reporting
+        process = subprocess.Popen(command, stderr=subprocess.PIPE)
+        stderr_tail = b""
+        while True:
+            chunk = process.stderr.read1(65536)
+            if not chunk:
+                break
+            sys.stderr.buffer.write(chunk)
+            sys.stderr.flush()
+            stderr_tail = (stderr_tail + chunk)[-STDERR_TAIL_SIZE:]
+        process.stderr.close()
+        
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, command,
+                stderr=stderr_tail.decode(errors='replace'))
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed:")
         print(f"Error: {e.stderr}")
         return False
+    except OSError as e:
+        # Without a shell, a missing executable raises instead of exiting 127
+        print(f"❌ {description} failed:")
+        print(f"Error: {e}")
+        return False
+
+def _copy_file_range(src, dst):
+    """Copy src to dst in the kernel with copy_file_range (reflink-capable)"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    shutil.copystat(src, dst)
+
+def _fast_copy(src, dst):
+    """Copy src to dst via hardlink, then copy_file_range, then shutil.copy2"""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    
+    # Linux only; lets btrfs/xfs/NFS reflink or copy server-side
+    if hasattr(os, 'copy_file_range'):
+        try:
+            _copy_file_range(src, dst)
+            return
+        except OSError:
+            if os.path.exists(dst):
+                os.remove(dst)
+    
+    # String paths let shutil use sendfile/fcopyfile internally
+    shutil.copy2(src, dst)
+
+def _async_rmtree(path):
+    """Rename a directory out of the way and delete it in the background"""
+    trash = f"{path}.del.{os.getpid()}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        # e.g. files held open on Windows; delete in place instead
+        shutil.rmtree(path)
+        return
+    # Leftovers of an earlier build that exited mid-delete go with it.
+    # Not a daemon thread, so the interpreter finishes the delete on exit
+    trash_dirs = [str(p) for p in Path(path).parent.glob(f"{Path(path).name}.del.*")]
+    threading.Thread(target=_rmtree_all, args=(trash_dirs,)).start()
+
+def _rmtree_all(paths):
+    """Delete each directory tree, ignoring errors"""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
 
 def install_pyinstaller():
     """Install PyInstaller if not already installed"""
@@ -30,23 +112,28 @@ def install_pyinstaller():
         return True
     except ImportError:
         print("📦 Installing PyInstaller...")
-        return run_command("pip install pyinstaller", "PyInstaller installation")
+        return run_command(["pip", "install", "pyinstaller"], "PyInstaller installation")
 
-def build_executable():
+def build_executable(fresh=False):
     """Build the executable using PyInstaller"""
     system = platform.system().lower()
     
-    # Clean previous builds
-    if os.path.exists('build'):
-        shutil.rmtree('build')
-    if os.path.exists('dist'):
-        shutil.rmtree('dist')
+    # Clean previous builds only when a fresh build is requested, so the
+    # PyInstaller work cache can be reused on incremental rebuilds
+    if fresh:
+        if os.path.exists('build'):
+            _async_rmtree('build')
+        if os.path.exists('dist'):
+            _async_rmtree('dist')
     
-    # Build command based on platform
+    # Build command based on platform; the analysis cache lives in a
+    # persistent workpath so it survives build/ cleanups
     if system == "windows":
-        cmd = "pyinstaller --clean bulk_video_downloader.spec"
+        cmd = ["pyinstaller", "--noconfirm", "--workpath", PYINSTALLER_CACHE, "--distpath", "dist", "bulk_video_downloader.spec"]
     else:
-        cmd = "pyinstaller --clean bulk_video_downloader.spec"
+        cmd = ["pyinstaller", "--noconfirm", "--workpath", PYINSTALLER_CACHE, "--distpath", "dist", "bulk_video_downloader.spec"]
+    if fresh:
+        cmd.append("--clean")
     
     return run_command(cmd, f"Building executable for {system}")
 
@@ -57,7 +144,7 @@ def create_release_package():
     
     # Create release directory
     if os.path.exists(release_dir):
-        shutil.rmtree(release_dir)
+        _async_rmtree(release_dir)
     os.makedirs(release_dir)
     
     # Copy executable
@@ -65,7 +152,7 @@ def create_release_package():
     exe_path = f"dist/{exe_name}"
     
     if os.path.exists(exe_path):
-        shutil.copy2(exe_path, release_dir)
+        _fast_copy(exe_path, release_dir)
         print(f"✅ Copied executable to {release_dir}/")
     else:
         print(f"❌ Executable not found at {exe_path}")
@@ -75,7 +162,7 @@ def create_release_package():
     files_to_copy = ['README.md', 'requirements.txt']
     for file in files_to_copy:
         if os.path.exists(file):
-            shutil.copy2(file, release_dir)
+            _fast_copy(file, release_dir)
             print(f"✅ Copied {file} to {release_dir}/")
     
     # Create a simple run script for Unix systems
@@ -94,6 +181,9 @@ def main():
     """Main build process"""
     print("🚀 Starting cross-platform build process...")
     
+    # Only wipe build/ and dist/ when explicitly asked to
+    fresh = '--fresh' in sys.argv[1:]
+    
     # Check if we're in the right directory
     if not os.path.exists('src/main.py'):
         print("❌ Error: Please run this script from the project root directory")
@@ -104,7 +194,7 @@ def main():
         sys.exit(1)
     
     # Build executable
-    if not build_executable():
+    if not build_executable(fresh=fresh):
         sys.exit(1)
     
     # Create release package
@@ -8,44 +8,61 @@ import os
 import sys
 import subprocess
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# The file generators run concurrently; keep their status lines whole
+_print_lock = threading.Lock()
+
+def log(message):
+    """Print a status line without interleaving with other threads"""
+    with _print_lock:
+        print(message)
+
 def create_dockerfile():
     """Create Dockerfile for cross-platform builds"""
     dockerfile_content = """
 # Multi-stage build for cross-platform distribution
-FROM python:3.9-slim as base
+# Layers are ordered from least to most frequently changing so that source
+# edits only invalidate the final COPY/pyinstaller layers
 
-# Install system dependencies
-RUN apt-get update && apt-get install -y \\
+# Builder stage: the C toolchain is only needed to install dependencies
+FROM python:3.9-slim AS builder
+RUN apt-get update && apt-get install -y --no-install-recommends \\
     build-essential \\
     libssl-dev \\
     libffi-dev \\
-    python3-dev \\
     && rm -rf /var/lib/apt/lists/*
-
-# Set working directory
 WORKDIR /app
-
-# Copy requirements and install Python dependencies
 COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
+RUN pip install --no-cache-dir --user -r requirements.txt
 
-# Copy source code
-COPY . .
+# Runtime base: no toolchain, just the tools PyInstaller shells out to
+FROM python:3.9-slim AS base
+RUN apt-get update && apt-get install -y --no-install-recommends binutils \\
+    && rm -rf /var/lib/apt/lists/*
+ENV PATH=/root/.local/bin:$PATH
+WORKDIR /app
 
 # Build stage for Windows (using wine)
-FROM base as windows-build
-RUN apt-get update && apt-get install -y wine && rm -rf /var/lib/apt/lists/*
+FROM base AS windows-build
+# Install wine before the Python dependencies so it stays cached
+RUN apt-get update && apt-get install -y --no-install-recommends wine \\
+    && rm -rf /var/lib/apt/lists/*
 RUN wine --version || true  # Initialize wine
+COPY --from=builder /root/.local /root/.local
+COPY . .
 RUN pyinstaller --clean bulk_video_downloader.spec
 
 # Build stage for Linux
-FROM base as linux-build
+FROM base AS linux-build
+COPY --from=builder /root/.local /root/.local
+COPY . .
 RUN pyinstaller --clean bulk_video_downloader.spec
 
 # Build stage for macOS (requires macOS host or cross-compilation tools)
-FROM base as macos-build
+FROM base AS macos-build
 # Note: macOS builds typically require a macOS host
 # This is a placeholder for CI/CD systems that support macOS
 RUN echo "macOS build would go here"
@@ -53,7 +70,7 @@ RUN echo "macOS build would go here"
     
     with open('Dockerfile', 'w') as f:
         f.write(dockerfile_content)
-    print("✅ Created Dockerfile for cross-platform builds")
+    log("✅ Created Dockerfile for cross-platform builds")
 
 def create_github_workflow():
     """Create GitHub Actions workflow for automated builds"""
@@ -66,8 +83,38 @@ on:
       - 'v*'
   workflow_dispatch:
 
+# Cancel superseded runs for the same ref
+concurrency:
+  group: build-${{ github.ref }}
+  cancel-in-progress: true
+
 jobs:
+  # Download the wheels once and share them with every matrix job
+  prefetch:
+    runs-on: ubuntu-latest
+
+    steps:
+    - uses: actions/checkout@v3
+
+    - name: Set up Python
+      uses: actions/setup-python@v4
+      with:
+        python-version: '3.9'
+        cache: 'pip'
+        cache-dependency-path: requirements.txt
+
+    - name: Download wheels
+      run: |
+        pip download -r requirements.txt -d wheels/
+
+    - name: Upload wheels
+      uses: actions/upload-artifact@v4
+      with:
+        name: wheels
+        path: wheels/
+
   build:
+    needs: prefetch
     strategy:
       matrix:
         include:
@@ -87,11 +134,29 @@ jobs:
       uses: actions/setup-python@v4
       with:
         python-version: '3.9'
+        cache: 'pip'
+        cache-dependency-path: requirements.txt
+
+    - name: Cache PyInstaller analysis
+      uses: actions/cache@v4
+      with:
+        path: .pyinstaller-cache
+        key: pyinstaller-${{ matrix.os }}-${{ hashFiles('bulk_video_downloader.spec', 'requirements.txt', 'src/**/*.py') }}
+        restore-keys: |
+          pyinstaller-${{ matrix.os }}-
+
+    - name: Download prefetched wheels
+      uses: actions/download-artifact@v4
+      with:
+        name: wheels
+        path: wheels/
 
+    # Platform-independent wheels come from the shared artifact; wheels for
+    # other OSes don't match, so those still resolve from the pip cache/PyPI
     - name: Install dependencies
       run: |
         python -m pip install --upgrade pip
-        pip install -r requirements.txt
+        pip install --find-links wheels/ -r requirements.txt
 
     - name: Build executable
       run: |
@@ -110,12 +175,30 @@ jobs:
         files: release_${{ matrix.platform }}/*
       env:
         GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
+
+  docker-build:
+    runs-on: ubuntu-latest
+
+    steps:
+    - uses: actions/checkout@v3
+
+    - name: Set up Docker Buildx
+      uses: docker/setup-buildx-action@v3
+
+    - name: Build Linux image
+      uses: docker/build-push-action@v5
+      with:
+        context: .
+        target: linux-build
+        push: false
+        cache-from: type=gha
+        cache-to: type=gha,mode=max
 """
     
     os.makedirs('.github/workflows', exist_ok=True)
     with open('.github/workflows/build.yml', 'w') as f:
         f.write(workflow_content)
-    print("✅ Created GitHub Actions workflow")
+    log("✅ Created GitHub Actions workflow")
 
 def create_manual_build_instructions():
     """Create manual build instructions for each platform"""
@@ -180,20 +263,22 @@ pyinstaller --clean bulk_video_downloader.spec
     
     with open('BUILD_INSTRUCTIONS.md', 'w') as f:
         f.write(instructions)
-    print("✅ Created manual build instructions")
+    log("✅ Created manual build instructions")
 
 def main():
     """Create all necessary files for cross-platform builds"""
     print("🔧 Setting up cross-platform build environment...")
     
-    # Create Docker setup
-    create_dockerfile()
-    
-    # Create GitHub Actions workflow
-    create_github_workflow()
-    
-    # Create manual instructions
-    create_manual_build_instructions()
+    # Docker setup, GitHub Actions workflow and manual instructions are
+    # independent file writes, so generate them concurrently
+    generators = [
+        create_dockerfile,
+        create_github_workflow,
+        create_manual_build_instructions,
+    ]
+    with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+        for future in [executor.submit(generator) for generator in generators]:
+            future.result()
     
     print("\n🎉 Cross-platform build setup completed!")
     print("\n📋 Next steps:")
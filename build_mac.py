@@ -8,20 +8,91 @@ import os
 import sys
 import subprocess
 import shutil
+import threading
 import platform
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from create_icon import icns_is_current, create_iconset
+
+# PyInstaller work directory, kept between runs to reuse its analysis cache
+PYINSTALLER_CACHE = ".pyinstaller-cache"
+
+# Fast deflate level for the ZIP distribution; most of a PyInstaller bundle
+# compresses poorly, so higher levels cost CPU for little size gain
+ZIP_COMPRESSLEVEL = 1
+
+# Payloads that are already compressed and are stored as-is in the ZIP
+PRECOMPRESSED_SUFFIXES = ('.zip', '.pyz', '.gz', '.bz2', '.xz', '.png', '.icns')
+
+# Bytes of stderr kept from a streamed command for the failure message
+STDERR_TAIL_SIZE = 4096
+
 def run_command(command, description):
     """Run a command and handle errors"""
     print(f"\n🔄 {description}...")
+    sys.stdout.flush()
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        # command is an argv list, run without a shell; stdout goes straight
+        # to our terminal, stderr is echoed as it arrives and only its tail
+        # is kept for error reporting
+        process = subprocess.Popen(command, stderr=subprocess.PIPE)
+        stderr_tail = b""
+        while True:
+            chunk = process.stderr.read1(65536)
+            if not chunk:
+                break
+            sys.stderr.buffer.write(chunk)
+            sys.stderr.flush()
+            stderr_tail = (stderr_tail + chunk)[-STDERR_TAIL_SIZE:]
+        process.stderr.close()
+        
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, command,
+                stderr=stderr_tail.decode(errors='replace'))
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed:")
         print(f"Error: {e.stderr}")
         return False
+    except OSError as e:
+        # Without a shell, a missing executable raises instead of exiting 127
+        print(f"❌ {description} failed:")
+        print(f"Error: {e}")
+        return False
+
+def _fast_copy(src, dst):
+    """Copy src to dst via hardlink, falling back to shutil.copy2"""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    try:
+        os.link(src, dst)
+    except OSError:
+        # String paths let shutil use fcopyfile(3) on macOS
+        shutil.copy2(src, dst)
+
+def _async_rmtree(path):
+    """Rename a directory out of the way and delete it in the background"""
+    trash = f"{path}.del.{os.getpid()}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        # e.g. files held open on Windows; delete in place instead
+        shutil.rmtree(path)
+        return
+    # Leftovers of an earlier build that exited mid-delete go with it.
+    # Not a daemon thread, so the interpreter finishes the delete on exit
+    trash_dirs = [str(p) for p in Path(path).parent.glob(f"{Path(path).name}.del.*")]
+    threading.Thread(target=_rmtree_all, args=(trash_dirs,)).start()
+
+def _rmtree_all(paths):
+    """Delete each directory tree, ignoring errors"""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
 
 def check_mac_environment():
     """Check if we're running on macOS"""
@@ -41,24 +112,31 @@ def install_dependencies():
         import PyInstaller
         print("✅ PyInstaller is already installed")
     except ImportError:
-        if not run_command("pip install pyinstaller", "Installing PyInstaller"):
+        if not run_command(["pip", "install", "pyinstaller"], "Installing PyInstaller"):
             return False
     
     # Install other dependencies
-    if not run_command("pip install -r requirements.txt", "Installing project dependencies"):
+    if not run_command(["pip", "install", "-r", "requirements.txt"], "Installing project dependencies"):
         return False
     
     return True
 
 def create_app_icon():
     """Create a simple app icon if none exists"""
+    # Checked before PIL is imported or anything is rendered
+    if icns_is_current():
+        print("✅ icon.icns is up to date")
+        return "icon.icns"
+    if os.path.exists("icon.png"):
+        # icon.icns is missing or older than icon.png; rebuild it from there
+        return "icon.icns" if create_iconset() else "icon.png"
+    
     icon_path = "icon.icns"
     if not os.path.exists(icon_path):
         print("📝 Creating a simple app icon...")
         # Create a simple 512x512 icon using Python (basic approach)
         try:
             from PIL import Image, ImageDraw
-            import io
             
             # Create a simple icon
             img = Image.new('RGBA', (512, 512), (0, 0, 0, 0))
@@ -74,7 +152,7 @@ def create_app_icon():
             print("✅ Created icon.png")
             
             # Convert to ICNS (requires iconutil on macOS)
-            if run_command("iconutil -c icns -o icon.icns icon.iconset", "Converting to ICNS"):
+            if run_command(["iconutil", "-c", "icns", "-o", "icon.icns", "icon.iconset"], "Converting to ICNS"):
                 print("✅ Created icon.icns")
             else:
                 print("⚠️  Could not create ICNS, will use PNG")
@@ -89,23 +167,28 @@ def create_app_icon():
     
     return icon_path
 
-def build_mac_app():
+def build_mac_app(fresh=False):
     """Build the Mac application using PyInstaller"""
     print("🔨 Building Mac application...")
     
-    # Clean previous builds
-    for dir_name in ['build', 'dist']:
-        if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
-            print(f"🧹 Cleaned {dir_name}/")
+    # Clean previous builds only when a fresh build is requested, so the
+    # PyInstaller work cache can be reused on incremental rebuilds
+    if fresh:
+        for dir_name in ['build', 'dist']:
+            if os.path.exists(dir_name):
+                _async_rmtree(dir_name)
+                print(f"🧹 Cleaned {dir_name}/")
     
     # Get icon path
     icon_path = create_app_icon()
     
-    # Build command for Mac
-    cmd = "pyinstaller --clean bulk_video_downloader.spec"
+    # Build command for Mac; the analysis cache lives in a persistent
+    # workpath so it survives build/ cleanups
+    cmd = ["pyinstaller", "--noconfirm", "--workpath", PYINSTALLER_CACHE, "--distpath", "dist", "bulk_video_downloader.spec"]
+    if fresh:
+        cmd.append("--clean")
     if icon_path:
-        cmd += f" --icon={icon_path}"
+        cmd.append(f"--icon={icon_path}")
     
     if not run_command(cmd, "Building Mac application"):
         return False
@@ -133,11 +216,17 @@ def create_dmg_installer():
     # Create a temporary directory for DMG contents
     dmg_dir = "dmg_contents"
     if os.path.exists(dmg_dir):
-        shutil.rmtree(dmg_dir)
+        _async_rmtree(dmg_dir)
     os.makedirs(dmg_dir)
     
-    # Copy the app to DMG directory
-    shutil.copytree(app_path, f"{dmg_dir}/BulkVideoDownloader.app")
+    # Clone the app into the DMG directory; on APFS `cp -c` uses clonefile(2)
+    # so the bundle is staged without copying its bytes
+    staged_app = f"{dmg_dir}/BulkVideoDownloader.app"
+    if not run_command(["cp", "-cRp", app_path, staged_app], "Cloning application bundle"):
+        print("⚠️  Clone not supported, falling back to a full copy")
+        if os.path.exists(staged_app):
+            shutil.rmtree(staged_app)
+        shutil.copytree(app_path, staged_app, symlinks=True)
     
     # Create a symbolic link to Applications folder
     os.symlink("/Applications", f"{dmg_dir}/Applications")
@@ -145,21 +234,69 @@ def create_dmg_installer():
     # Copy README and other files
     for file in ['README.md', 'requirements.txt']:
         if os.path.exists(file):
-            shutil.copy2(file, dmg_dir)
+            _fast_copy(file, dmg_dir)
     
     # Create DMG using hdiutil
-    dmg_cmd = f"hdiutil create -volname 'Bulk Video Downloader' -srcfolder {dmg_dir} -ov -format UDZO {dmg_name}.dmg"
+    dmg_cmd = ["hdiutil", "create", "-volname", "Bulk Video Downloader", "-srcfolder", dmg_dir,
+               "-ov", "-format", "UDZO", f"{dmg_name}.dmg"]
     
     if run_command(dmg_cmd, "Creating DMG installer"):
         print(f"✅ DMG installer created: {dmg_name}.dmg")
         
         # Clean up temporary directory
-        shutil.rmtree(dmg_dir)
+        _async_rmtree(dmg_dir)
         return True
     else:
         print("❌ Failed to create DMG installer")
         return False
 
+def _scandir_files(path):
+    """Yield file paths under path, using cached DirEntry types instead of stat"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # Like os.walk, don't descend into symlinked directories
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+def _deflate_file(file_path, arc_path):
+    """Compress a single file for the ZIP archive (runs in a worker process)"""
+    zinfo = zipfile.ZipInfo.from_file(file_path, arc_path)
+    
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    
+    if file_path.lower().endswith(PRECOMPRESSED_SUFFIXES):
+        zinfo.compress_type = zipfile.ZIP_STORED
+        compressed = data
+    else:
+        # Raw deflate stream (no zlib header), as stored inside ZIP entries
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        compressor = zlib.compressobj(ZIP_COMPRESSLEVEL, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+    
+    zinfo.CRC = zlib.crc32(data)
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(compressed)
+    return zinfo, compressed
+
+def _write_precompressed(zipf, zinfo, compressed):
+    """Append an already-compressed entry to an open ZipFile"""
+    zip64 = (zinfo.file_size > zipfile.ZIP64_LIMIT or
+             zinfo.compress_size > zipfile.ZIP64_LIMIT)
+    
+    # Same bookkeeping ZipFile.write() does for entries it writes itself,
+    # so close() emits a correct central directory
+    zinfo.header_offset = zipf.fp.tell()
+    zipf._writecheck(zinfo)
+    zipf._didModify = True
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+    zipf.fp.write(zinfo.FileHeader(zip64))
+    zipf.fp.write(compressed)
+    zipf.start_dir = zipf.fp.tell()
+
 def create_zip_distribution():
     """Create a ZIP distribution as fallback"""
     print("📦 Creating ZIP distribution...")
@@ -171,15 +308,18 @@ def create_zip_distribution():
         print("❌ Application not found, cannot create ZIP")
         return False
     
-    # Create ZIP using Python
-    import zipfile
+    file_paths = []
+    arc_paths = []
+    for file_path in _scandir_files(app_path):
+        file_paths.append(file_path)
+        arc_paths.append(os.path.relpath(file_path, "dist"))
     
-    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(app_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arc_path = os.path.relpath(file_path, "dist")
-                zipf.write(file_path, arc_path)
+    # Deflate files in parallel and write the entries in walk order
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, \
+            zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED,
+                            compresslevel=ZIP_COMPRESSLEVEL) as zipf:
+        for zinfo, compressed in executor.map(_deflate_file, file_paths, arc_paths, chunksize=16):
+            _write_precompressed(zipf, zinfo, compressed)
     
     print(f"✅ ZIP distribution created: {zip_name}")
     return True
@@ -194,7 +334,7 @@ def test_application():
         return False
     
     # Try to run the application
-    test_cmd = f"open {app_path}"
+    test_cmd = ["open", app_path]
     if run_command(test_cmd, "Testing application launch"):
         print("✅ Application launched successfully")
         return True
@@ -206,6 +346,9 @@ def main():
     """Main build process for Mac"""
     print("🍎 Starting Mac build process for Bulk Video Downloader...")
     
+    # Only wipe build/ and dist/ when explicitly asked to
+    fresh = '--fresh' in sys.argv[1:]
+    
     # Check environment
     if not check_mac_environment():
         sys.exit(1)
@@ -216,7 +359,7 @@ def main():
         sys.exit(1)
     
     # Build the application
-    if not build_mac_app():
+    if not build_mac_app(fresh=fresh):
         print("❌ Failed to build Mac application")
         sys.exit(1)
     
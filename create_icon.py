@@ -6,56 +6,71 @@ Creates a basic app icon in various formats
 
 import os
 import sys
+import hashlib
+import importlib.util
 from pathlib import Path
 
+# Records the sha256 of the icon.png that icon.icns was last built from
+ICON_MANIFEST = Path(".icon.manifest")
+
 def create_simple_icon():
     """Create a simple icon using basic Python libraries"""
-    try:
-        from PIL import Image, ImageDraw, ImageFont
+    # Nothing to render if icon.icns was built from the current icon.png;
+    # PIL isn't even imported in that case
+    if icns_is_current():
+        print("✅ icon.png and icon.icns are up to date")
+        return True
+    
+    # Only check that Pillow is installed; it is imported where it's used
+    if importlib.util.find_spec("PIL") is not None:
         print("✅ PIL available, creating icon with PIL")
         return create_pil_icon()
-    except ImportError:
+    else:
         print("⚠️  PIL not available, creating basic icon")
         return create_basic_icon()
 
 def create_pil_icon():
     """Create icon using PIL"""
     try:
-        # Create a 512x512 image
-        size = 512
+        from PIL import Image, ImageDraw
+        
+        # Render once at 1024x1024 (the largest iconset tier); the drawing
+        # below is laid out on a 512 grid and scaled up
+        size = 1024
+        scale = size // 512
         img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         
         # Background circle
-        margin = 20
+        margin = 20 * scale
         draw.ellipse([margin, margin, size-margin, size-margin], 
-                    fill=(52, 152, 219), outline=(41, 128, 185), width=8)
+                    fill=(52, 152, 219), outline=(41, 128, 185), width=8 * scale)
         
         # Inner circle
-        inner_margin = 80
+        inner_margin = 80 * scale
         draw.ellipse([inner_margin, inner_margin, size-inner_margin, size-inner_margin], 
-                    fill=(236, 240, 241), outline=(189, 195, 199), width=4)
+                    fill=(236, 240, 241), outline=(189, 195, 199), width=4 * scale)
         
         # Video camera icon
         # Camera body
-        body_x = size // 2 - 60
-        body_y = size // 2 - 40
-        body_width = 120
-        body_height = 80
+        body_x = size // 2 - 60 * scale
+        body_y = size // 2 - 40 * scale
+        body_width = 120 * scale
+        body_height = 80 * scale
         draw.rounded_rectangle([body_x, body_y, body_x + body_width, body_y + body_height], 
-                             radius=10, fill=(52, 152, 219))
+                             radius=10 * scale, fill=(52, 152, 219))
         
         # Lens
         lens_center_x = size // 2
-        lens_center_y = size // 2 - 10
-        lens_radius = 30
+        lens_center_y = size // 2 - 10 * scale
+        lens_radius = 30 * scale
         draw.ellipse([lens_center_x - lens_radius, lens_center_y - lens_radius,
                      lens_center_x + lens_radius, lens_center_y + lens_radius], 
-                    fill=(236, 240, 241), outline=(189, 195, 199), width=3)
+                    fill=(236, 240, 241), outline=(189, 195, 199), width=3 * scale)
         
         # Play button triangle
-        triangle_size = 20
-        triangle_x = lens_center_x - 5
+        triangle_size = 20 * scale
+        triangle_x = lens_center_x - 5 * scale
         triangle_y = lens_center_y - triangle_size // 2
         draw.polygon([
             (triangle_x, triangle_y),
@@ -63,12 +78,12 @@ def create_pil_icon():
             (triangle_x + triangle_size, triangle_y + triangle_size // 2)
         ], fill=(52, 152, 219))
         
-        # Save as PNG
-        img.save("icon.png", "PNG")
+        # Save as PNG (512x512)
+        img.reduce(scale).save("icon.png", "PNG")
         print("✅ Created icon.png")
         
-        # Create iconset for ICNS
-        create_iconset()
+        # Create iconset for ICNS from the full-size render
+        create_iconset(img)
         
         return True
         
@@ -76,59 +91,87 @@ def create_pil_icon():
         print(f"❌ Error creating PIL icon: {e}")
         return False
 
-def create_iconset():
+# Iconset file names for each rendered size; sizes shared by two entries
+# (e.g. 32x32 and 16x16@2x) are encoded once and written twice
+ICONSET_FILES = {
+    16: ["icon_16x16.png"],
+    32: ["icon_16x16@2x.png", "icon_32x32.png"],
+    64: ["icon_32x32@2x.png", "icon_64x64.png"],
+    128: ["icon_64x64@2x.png", "icon_128x128.png"],
+    256: ["icon_128x128@2x.png", "icon_256x256.png"],
+    512: ["icon_256x256@2x.png", "icon_512x512.png"],
+    1024: ["icon_512x512@2x.png"],
+}
+
+def _icon_png_digest():
+    """Return the sha256 hex digest of icon.png"""
+    return hashlib.sha256(Path("icon.png").read_bytes()).hexdigest()
+
+def icns_is_current():
+    """Check whether icon.icns was built from the current icon.png"""
+    if not all(os.path.exists(path) for path in ("icon.png", "icon.icns", ICON_MANIFEST)):
+        return False
+    return ICON_MANIFEST.read_text().strip() == _icon_png_digest()
+
+def create_iconset(original=None):
     """Create iconset directory for ICNS conversion"""
     try:
-        from PIL import Image
-        
-        # Create iconset directory
-        iconset_dir = Path("icon.iconset")
-        iconset_dir.mkdir(exist_ok=True)
-        
-        # Required sizes for macOS
-        sizes = [16, 32, 64, 128, 256, 512, 1024]
-        
-        # Load the original image
-        original = Image.open("icon.png")
+        # Skip resizing and iconutil entirely if icon.png is unchanged
+        if icns_is_current():
+            print("✅ icon.icns is up to date")
+            return True
         
-        for size in sizes:
-            # Resize image
-            resized = original.resize((size, size), Image.Resampling.LANCZOS)
-            
-            # Save with appropriate name
-            if size == 16:
-                resized.save(iconset_dir / "icon_16x16.png")
-            elif size == 32:
-                resized.save(iconset_dir / "icon_16x16@2x.png")
-                resized.save(iconset_dir / "icon_32x32.png")
-            elif size == 64:
-                resized.save(iconset_dir / "icon_32x32@2x.png")
-                resized.save(iconset_dir / "icon_64x64.png")
-            elif size == 128:
-                resized.save(iconset_dir / "icon_64x64@2x.png")
-                resized.save(iconset_dir / "icon_128x128.png")
-            elif size == 256:
-                resized.save(iconset_dir / "icon_128x128@2x.png")
-                resized.save(iconset_dir / "icon_256x256.png")
-            elif size == 512:
-                resized.save(iconset_dir / "icon_256x256@2x.png")
-                resized.save(iconset_dir / "icon_512x512.png")
-            elif size == 1024:
-                resized.save(iconset_dir / "icon_512x512@2x.png")
-        
-        print("✅ Created icon.iconset directory")
-        
-        # Convert to ICNS
+        from PIL import Image
+        import io
+        import shutil
         import subprocess
-        result = subprocess.run([
-            "iconutil", "-c", "icns", "-o", "icon.icns", "icon.iconset"
-        ], capture_output=True, text=True)
+        import tempfile
+        
+        # Load the original image unless a render was passed in
+        if original is None:
+            original = Image.open("icon.png")
+        if original.size != (1024, 1024):
+            # reducing_gap lets Pillow box-reduce oversized sources before
+            # the LANCZOS pass (it has no effect when upscaling)
+            original = original.resize((1024, 1024), Image.Resampling.LANCZOS,
+                                       reducing_gap=2.0)
+        
+        # Halve with PIL's box reduction down to 32x32; only the smallest
+        # tier gets a full LANCZOS resample
+        tiers = {1024: original}
+        current = original
+        while current.width > 32:
+            current = current.reduce(2)
+            tiers[current.width] = current
+        tiers[16] = current.resize((16, 16), Image.Resampling.LANCZOS,
+                                   reducing_gap=2.0)
+        
+        # Stage the iconset in the system temp directory rather than the
+        # project; iconutil requires the directory name to end in .iconset
+        iconset_dir = Path(tempfile.mkdtemp(suffix=".iconset"))
+        try:
+            for size, names in ICONSET_FILES.items():
+                # iconutil re-encodes into the .icns container, so these
+                # intermediate PNGs only need the cheapest compression
+                buffer = io.BytesIO()
+                tiers[size].save(buffer, "PNG", optimize=False, compress_level=1)
+                data = buffer.getvalue()
+                for name in names:
+                    (iconset_dir / name).write_bytes(data)
+            
+            print("✅ Created iconset directory")
+            
+            # Convert to ICNS
+            result = subprocess.run([
+                "iconutil", "-c", "icns", "-o", "icon.icns", str(iconset_dir)
+            ], capture_output=True, text=True)
+        finally:
+            # Clean up iconset directory
+            shutil.rmtree(iconset_dir, ignore_errors=True)
         
         if result.returncode == 0:
             print("✅ Created icon.icns")
-            # Clean up iconset directory
-            import shutil
-            shutil.rmtree(iconset_dir)
+            ICON_MANIFEST.write_text(_icon_png_digest())
             return True
         else:
             print(f"⚠️  Could not create ICNS: {result.stderr}")
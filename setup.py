@@ -44,7 +44,6 @@ setup(
         "Topic :: Internet :: WWW/HTTP :: Browsers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
@@ -55,7 +54,7 @@ setup(
     keywords="video, downloader, bulk, PyQt, GUI, web scraping, crawler",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     install_requires=read_requirements(),
     extras_require={
         "dev": [
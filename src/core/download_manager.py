@@ -4,7 +4,9 @@ Download manager for handling multiple concurrent video downloads
 """
 
 import os
+import shutil
 import asyncio
+import functools
 import aiohttp
 import aiofiles
 from typing import List, Dict, Optional, Callable
@@ -14,8 +16,38 @@ import yt_dlp
 import logging
 from pathlib import Path
 import time
-from concurrent.futures import ThreadPoolExecutor
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .video_crawler import USER_AGENT
+
+
+# Chunk size used when streaming direct video downloads
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Downloaded chunks are gathered and written to disk this many bytes at a time
+DOWNLOAD_WRITE_BUFFER = 1 << 20
+
+# Files at least this large are fetched as parallel HTTP Range requests
+RANGED_DOWNLOAD_MIN_SIZE = 10 * 1024 * 1024
+RANGED_DOWNLOAD_PARTS = 4
+
+# Large files can take far longer than aiohttp's default 5 minute total
+# timeout; only stalled connects and reads count as failures
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+
+# yt-dlp format selection: separate mp4 video and m4a audio streams merge
+# into mp4 with a container remux rather than a re-encode, but that needs
+# ffmpeg; without it, take the best single-file stream
+YTDLP_MERGED_FORMAT = 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best'
+YTDLP_SINGLE_FORMAT = 'best[ext=mp4]/best'
+
+# Minimum seconds between progress callbacks for one task
+PROGRESS_EMIT_INTERVAL = 0.1
+
+
+class RangeNotSatisfied(Exception):
+    """Raised when a server ignores a Range request"""
 
 
 class DownloadStatus(Enum):
@@ -42,6 +74,8 @@ class DownloadTask:
     start_time: Optional[float] = None
     end_time: Optional[float] = None
     output_path: Optional[str] = None
+    _last_emit: float = field(default=0.0, repr=False)  # monotonic time of the last on_progress
+    last_reported_pct: int = -1  # whole percent last shown by the UI
     
     def __post_init__(self):
         self.task_id = id(self)
@@ -70,19 +104,34 @@ class DownloadProgressCallback:
 class DownloadManager:
     """Manages multiple concurrent video downloads"""
     
+    # Maps characters that are invalid in filenames to '_'
+    _SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+    
     def __init__(self, max_concurrent: int = 3, download_folder: str = "~/Downloads/BulkVideos"):
         self.max_concurrent = max_concurrent
         self.download_folder = os.path.expanduser(download_folder)
         self.download_tasks: Dict[int, DownloadTask] = {}
         self.active_downloads: Dict[int, DownloadTask] = {}
+        
+        # Tasks indexed by status, kept in queue order, plus a running total
+        # of task progress so the stats queries need not scan every task
+        self._by_status: Dict[DownloadStatus, Dict[int, DownloadTask]] = {s: {} for s in DownloadStatus}
+        self._sum_progress = 0.0
+        self._progress_lock = threading.Lock()
         self.callback: Optional[DownloadProgressCallback] = None
-        self.executor = ThreadPoolExecutor(max_workers=max_concurrent)
         self.running = False
         self.paused = False
         
         # Create download folder if it doesn't exist
         os.makedirs(self.download_folder, exist_ok=True)
         
+        # All downloads run as coroutines on one event loop in a background
+        # thread; created on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        
         self.logger = logging.getLogger(__name__)
         
     def set_callback(self, callback: DownloadProgressCallback):
@@ -93,6 +142,7 @@ class DownloadManager:
         """Add a video to the download queue"""
         task = DownloadTask(video_info=video_info)
         self.download_tasks[task.task_id] = task
+        self._by_status[task.status][task.task_id] = task
         
         self.logger.info(f"Added download task: {video_info.title}")
         
@@ -119,8 +169,7 @@ class DownloadManager:
         self.paused = False
         
         # Start pending downloads up to the concurrent limit
-        pending_tasks = [task for task in self.download_tasks.values() 
-                        if task.status == DownloadStatus.PENDING]
+        pending_tasks = self.get_pending_tasks()
         
         for task in pending_tasks[:self.max_concurrent]:
             self._start_download(task)
@@ -132,17 +181,14 @@ class DownloadManager:
         self.paused = True
         for task in self.active_downloads.values():
             if task.status == DownloadStatus.DOWNLOADING:
-                task.status = DownloadStatus.PAUSED
-                if self.callback:
-                    self.callback.on_status_change(task, DownloadStatus.DOWNLOADING, DownloadStatus.PAUSED)
+                self._set_status(task, DownloadStatus.PAUSED)
                     
         self.logger.info("Downloads paused")
         
     def resume_downloads(self):
         """Resume paused downloads"""
         self.paused = False
-        paused_tasks = [task for task in self.download_tasks.values() 
-                       if task.status == DownloadStatus.PAUSED]
+        paused_tasks = list(self._by_status[DownloadStatus.PAUSED].values())
         
         for task in paused_tasks:
             if len(self.active_downloads) < self.max_concurrent:
@@ -158,12 +204,9 @@ class DownloadManager:
         
         # Cancel active downloads
         for task in self.active_downloads.values():
-            task.status = DownloadStatus.CANCELLED
-            if self.callback:
-                self.callback.on_status_change(task, task.status, DownloadStatus.CANCELLED)
+            self._set_status(task, DownloadStatus.CANCELLED)
                 
         self.active_downloads.clear()
-        self.executor.shutdown(wait=False)
         
         self.logger.info("Download manager stopped")
         
@@ -174,10 +217,13 @@ class DownloadManager:
             
             # Cancel if active
             if task_id in self.active_downloads:
-                task.status = DownloadStatus.CANCELLED
+                self._set_status(task, DownloadStatus.CANCELLED, notify=False)
                 del self.active_downloads[task_id]
                 
             del self.download_tasks[task_id]
+            del self._by_status[task.status][task_id]
+            with self._progress_lock:
+                self._sum_progress -= task.progress
             
             self.logger.info(f"Removed download task: {task_id}")
             
@@ -195,40 +241,100 @@ class DownloadManager:
         
     def get_pending_tasks(self) -> List[DownloadTask]:
         """Get pending download tasks"""
-        return [task for task in self.download_tasks.values() 
-                if task.status == DownloadStatus.PENDING]
+        return list(self._by_status[DownloadStatus.PENDING].values())
         
     def get_completed_tasks(self) -> List[DownloadTask]:
         """Get completed download tasks"""
-        return [task for task in self.download_tasks.values() 
-                if task.status == DownloadStatus.COMPLETED]
+        return list(self._by_status[DownloadStatus.COMPLETED].values())
         
     def get_failed_tasks(self) -> List[DownloadTask]:
         """Get failed download tasks"""
-        return [task for task in self.download_tasks.values() 
-                if task.status == DownloadStatus.FAILED]
+        return list(self._by_status[DownloadStatus.FAILED].values())
+        
+    def _is_live(self, task: DownloadTask) -> bool:
+        """Whether a task is still tracked; removed and cancelled tasks are final"""
+        return task.task_id in self.download_tasks and task.status != DownloadStatus.CANCELLED
         
+    def _set_status(self, task: DownloadTask, new_status: DownloadStatus, notify: bool = True):
+        """Move a task to a new status, keeping the status index current"""
+        if not self._is_live(task):
+            return
+            
+        old_status = task.status
+        self._by_status[old_status].pop(task.task_id, None)
+        self._by_status[new_status][task.task_id] = task
+        task.status = new_status
+        
+        if notify and self.callback:
+            self.callback.on_status_change(task, old_status, new_status)
+            
+    def _set_progress(self, task: DownloadTask, progress: float):
+        """Set a task's progress, keeping the running total current"""
+        if not self._is_live(task):
+            return
+            
+        with self._progress_lock:
+            self._sum_progress += progress - task.progress
+            task.progress = progress
+            
+
     def _start_download(self, task: DownloadTask):
         """Start a download task"""
         if task.task_id in self.active_downloads:
             return
             
-        task.status = DownloadStatus.DOWNLOADING
         task.start_time = time.time()
         self.active_downloads[task.task_id] = task
-        
-        if self.callback:
-            self.callback.on_status_change(task, DownloadStatus.PENDING, DownloadStatus.DOWNLOADING)
+        self._set_status(task, DownloadStatus.DOWNLOADING)
             
-        # Submit to thread pool
-        future = self.executor.submit(self._download_video, task)
+        # Schedule on the download event loop
+        future = asyncio.run_coroutine_threadsafe(self._download_video_async(task), self._get_loop())
         future.add_done_callback(lambda f: self._on_download_complete(task, f))
         
-    def _download_video(self, task: DownloadTask):
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the download event loop, starting its thread if needed"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._run_loop, name="DownloadLoop", daemon=True)
+            self._loop_thread.start()
+        return self._loop
+        
+    @functools.cached_property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for yt-dlp downloads, created on first use"""
+        # Direct downloads never leave the event loop; only the blocking
+        # yt-dlp fallback needs threads, and no more than there are cores
+        return ThreadPoolExecutor(max_workers=min(self.max_concurrent, os.cpu_count() or 4),
+                                  thread_name_prefix='ytdl')
+        
+    def _run_loop(self):
+        """Run the download event loop until it is stopped"""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session shared by all direct downloads"""
+        if self._session is None:
+            # One keep-alive connection pool for every download, so TLS
+            # handshakes and DNS lookups are reused across files per host
+            self._connector = aiohttp.TCPConnector(
+                limit=2 * self.max_concurrent * RANGED_DOWNLOAD_PARTS,
+                limit_per_host=self.max_concurrent * RANGED_DOWNLOAD_PARTS,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=self._connector,
+                headers={'User-Agent': USER_AGENT},
+                timeout=DOWNLOAD_TIMEOUT,
+            )
+        return self._session
+        
+    async def _download_video_async(self, task: DownloadTask):
         """Download a single video"""
+        video_info = task.video_info
         try:
-            video_info = task.video_info
-            
             # Determine output filename
             filename = self._sanitize_filename(video_info.title)
             if video_info.file_type != "unknown":
@@ -239,31 +345,36 @@ class DownloadManager:
             output_path = os.path.join(self.download_folder, filename)
             task.output_path = output_path
             
-            # Use yt-dlp for downloading
-            ydl_opts = {
-                'outtmpl': output_path,
-                'progress_hooks': [lambda d: self._progress_hook(task, d)],
-                'format': 'best',  # Download best quality
-                'quiet': True,
-                'no_warnings': True,
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([video_info.url])
+            if self._is_direct_file(video_info):
+                # Plain video file: stream it straight to disk
+                await self._download_direct(task, output_path)
+            else:
+                # Platform or page URL: let yt-dlp extract it, off the loop
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self.executor, self._download_with_ytdlp, task, output_path)
                 
-            # Mark as completed
-            task.status = DownloadStatus.COMPLETED
-            task.progress = 100.0
+            if not self._is_live(task):
+                return
+                
+            # Mark as completed; on_complete reports it, and sees the task
+            # as no longer active
+            self._set_status(task, DownloadStatus.COMPLETED, notify=False)
+            self._set_progress(task, 100.0)
             task.end_time = time.time()
+            self.active_downloads.pop(task.task_id, None)
             
             if self.callback:
                 self.callback.on_complete(task)
                 
         except Exception as e:
-            # Mark as failed
-            task.status = DownloadStatus.FAILED
+            if not self._is_live(task):
+                return
+                
+            # Mark as failed; on_error reports it
+            self._set_status(task, DownloadStatus.FAILED, notify=False)
             task.error_message = str(e)
             task.end_time = time.time()
+            self.active_downloads.pop(task.task_id, None)
             
             if self.callback:
                 self.callback.on_error(task, str(e))
@@ -279,14 +390,169 @@ class DownloadManager:
             if self.running and not self.paused:
                 self._start_next_pending_download()
                 
+    def _is_direct_file(self, video_info: 'VideoInfo') -> bool:
+        """Check whether a video points at a plain file we can stream"""
+        # The crawler sets file_type to the URL's video extension; anything
+        # else (embedded players, /video/ pages) needs yt-dlp's extractors
+        return video_info.file_type.startswith('.')
+        
+    async def _download_direct(self, task: DownloadTask, output_path: str):
+        """Download a direct video file, in parallel ranges when possible"""
+        session = await self._get_session()
+        url = task.video_info.url
+        
+        # Probe for size and byte-range support; servers that reject HEAD
+        # just get a plain streamed GET
+        size = None
+        accepts_ranges = False
+        try:
+            async with session.head(url, allow_redirects=True) as head:
+                if head.status == 200:
+                    size = head.content_length
+                    accepts_ranges = head.headers.get('Accept-Ranges', '').lower() == 'bytes'
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+            
+        if accepts_ranges and size and size >= RANGED_DOWNLOAD_MIN_SIZE:
+            try:
+                await self._download_ranged(task, url, size, output_path)
+                return
+            except RangeNotSatisfied:
+                self.logger.info(f"Server ignored Range requests, streaming {url}")
+                
+        await self._download_stream(task, url, output_path)
+        
+    async def _download_ranged(self, task: DownloadTask, url: str, size: int, output_path: str,
+                               n_parts: int = RANGED_DOWNLOAD_PARTS):
+        """Fetch a file as n_parts concurrent byte ranges"""
+        task.total_bytes = size
+        task.downloaded_bytes = 0
+        
+        # Size the file up front so each part can write at its own offset.
+        # Allocating the blocks in one go also spares the filesystem from
+        # growing the file piecemeal as parts land out of order; where that
+        # isn't supported (macOS, some filesystems) a sparse file will do
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                os.posix_fallocate(fd, 0, size)
+            except (AttributeError, OSError):
+                os.ftruncate(fd, size)
+        finally:
+            os.close(fd)
+            
+        ranges = [(i * size // n_parts, (i + 1) * size // n_parts - 1) for i in range(n_parts)]
+        parts = [asyncio.ensure_future(self._fetch_range(task, url, lo, hi, output_path))
+                 for lo, hi in ranges]
+        try:
+            await asyncio.gather(*parts)
+        except BaseException:
+            # Stop the other parts before the caller retries or gives up,
+            # so nothing keeps writing into the file
+            for part in parts:
+                part.cancel()
+            await asyncio.gather(*parts, return_exceptions=True)
+            raise
+        
+    async def _fetch_range(self, task: DownloadTask, url: str, lo: int, hi: int, output_path: str):
+        """Fetch bytes lo..hi (inclusive) of url into the same offsets of output_path"""
+        session = await self._get_session()
+        async with session.get(url, headers={'Range': f'bytes={lo}-{hi}'}) as response:
+            response.raise_for_status()
+            if response.status != 206:
+                raise RangeNotSatisfied(url)
+                
+            # Parts write disjoint regions, so each just seeks once. Progress
+            # updates need no lock: they all run on the event loop thread
+            async with aiofiles.open(output_path, 'r+b') as f:
+                await f.seek(lo)
+                await self._write_body(task, response, f)
+                    
+    async def _download_stream(self, task: DownloadTask, url: str, output_path: str):
+        """Stream a direct video file to disk over a single GET"""
+        session = await self._get_session()
+        async with session.get(url) as response:
+            response.raise_for_status()
+            task.total_bytes = response.content_length or 0
+            task.downloaded_bytes = 0
+            
+            async with aiofiles.open(output_path, 'wb') as f:
+                await self._write_body(task, response, f)
+                
+    async def _write_body(self, task: DownloadTask, response: aiohttp.ClientResponse, f):
+        """Copy a response body into an open aiofiles file, stopping if cancelled"""
+        # Every aiofiles write is a round-trip to a worker thread, so chunks
+        # are gathered and handed over DOWNLOAD_WRITE_BUFFER bytes at a time
+        buffer = bytearray()
+        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+            if task.status == DownloadStatus.CANCELLED:
+                return
+            buffer += chunk
+            if len(buffer) >= DOWNLOAD_WRITE_BUFFER:
+                await f.write(buffer)
+                buffer = bytearray()
+            self._update_progress(task, len(chunk))
+            
+        if buffer:
+            await f.write(buffer)
+            
+    def _update_progress(self, task: DownloadTask, nbytes: int):
+        """Account for newly downloaded bytes and notify the callback"""
+        task.downloaded_bytes += nbytes
+        if task.total_bytes:
+            self._set_progress(task, (task.downloaded_bytes / task.total_bytes) * 100)
+            
+        elapsed = time.time() - task.start_time
+        if elapsed > 0:
+            task.speed = task.downloaded_bytes / elapsed
+            if task.total_bytes and task.speed:
+                task.eta = int((task.total_bytes - task.downloaded_bytes) / task.speed)
+                
+        self._emit_progress(task, final=bool(task.total_bytes) and task.downloaded_bytes >= task.total_bytes)
+        
+    def _emit_progress(self, task: DownloadTask, final: bool = False):
+        """Notify the callback of progress, at most every PROGRESS_EMIT_INTERVAL"""
+        # Chunks arrive far faster than anyone can watch; the final update
+        # always goes through so listeners see the download reach 100%
+        now = time.monotonic()
+        if final or now - task._last_emit >= PROGRESS_EMIT_INTERVAL:
+            task._last_emit = now
+            if self.callback:
+                self.callback.on_progress(task)
+            
+    def _download_with_ytdlp(self, task: DownloadTask, output_path: str):
+        """Download a video with yt-dlp (blocking, runs in an executor)"""
+        ydl_opts = {
+            'outtmpl': output_path,
+            'progress_hooks': [lambda d: self._progress_hook(task, d)],
+            'format': YTDLP_MERGED_FORMAT if shutil.which('ffmpeg') else YTDLP_SINGLE_FORMAT,
+            'merge_output_format': 'mp4',
+            # Fetch HLS/DASH fragments in parallel, and plain streams as
+            # chunked range requests
+            'concurrent_fragment_downloads': 4,
+            'http_chunk_size': 10 * 1024 * 1024,
+            'retries': 5,
+            'fragment_retries': 5,
+            'quiet': True,
+            'no_warnings': True,
+        }
+        
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            ydl.download([task.video_info.url])
+                
     def _progress_hook(self, task: DownloadTask, d: Dict):
         """Progress hook for yt-dlp"""
+        # yt-dlp has no other way to interrupt a running download: raising
+        # from the hook aborts it, so the executor thread can finish
+        if not self._is_live(task):
+            raise yt_dlp.utils.DownloadCancelled(f"Download cancelled: {task.video_info.title}")
+            
         if d['status'] == 'downloading':
             # Update progress
             if 'total_bytes' in d and d['total_bytes']:
                 task.total_bytes = d['total_bytes']
                 task.downloaded_bytes = d.get('downloaded_bytes', 0)
-                task.progress = (task.downloaded_bytes / task.total_bytes) * 100
+                self._set_progress(task, (task.downloaded_bytes / task.total_bytes) * 100)
                 
             if 'speed' in d:
                 task.speed = d['speed']
@@ -294,11 +560,15 @@ class DownloadManager:
             if 'eta' in d:
                 task.eta = d['eta']
                 
-            if self.callback:
-                self.callback.on_progress(task)
+            self._emit_progress(task)
+        elif d['status'] == 'finished':
+            self._emit_progress(task, final=True)
                 
     def _on_download_complete(self, task: DownloadTask, future):
         """Called when a download task completes"""
+        if future.cancelled():
+            # Cancelled by cleanup()
+            return
         try:
             # Check if there was an exception
             future.result()
@@ -311,41 +581,32 @@ class DownloadManager:
         if len(self.active_downloads) >= self.max_concurrent:
             return
             
-        pending_tasks = [task for task in self.download_tasks.values() 
-                        if task.status == DownloadStatus.PENDING]
-        
-        if pending_tasks:
-            next_task = pending_tasks[0]
+        # The pending index is in queue order, so the first entry is next
+        next_task = next(iter(self._by_status[DownloadStatus.PENDING].values()), None)
+        if next_task is not None:
             self._start_download(next_task)
             
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for filesystem compatibility"""
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-            
-        # Limit length
-        if len(filename) > 200:
-            filename = filename[:200]
-            
-        return filename.strip()
+        # Replace invalid characters and limit length
+        return filename.translate(self._SANITIZE_TABLE)[:200].strip()
         
     def get_overall_progress(self) -> float:
         """Get overall progress across all tasks"""
         if not self.download_tasks:
             return 0.0
             
-        total_progress = sum(task.progress for task in self.download_tasks.values())
-        return total_progress / len(self.download_tasks)
+        # Rounded, since the running total picks up float error from its
+        # many small increments (80% must not show as 79.9999...)
+        return round(self._sum_progress / len(self.download_tasks), 6)
         
     def get_download_stats(self) -> Dict:
         """Get download statistics"""
         total_tasks = len(self.download_tasks)
-        completed = len(self.get_completed_tasks())
-        failed = len(self.get_failed_tasks())
+        completed = len(self._by_status[DownloadStatus.COMPLETED])
+        failed = len(self._by_status[DownloadStatus.FAILED])
         active = len(self.active_downloads)
-        pending = len(self.get_pending_tasks())
+        pending = len(self._by_status[DownloadStatus.PENDING])
         
         return {
             'total': total_tasks,
@@ -356,8 +617,36 @@ class DownloadManager:
             'overall_progress': self.get_overall_progress()
         }
         
+    async def _shutdown(self):
+        """Cancel outstanding downloads and close the HTTP session"""
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if self._session is not None:
+            # Also closes the connector, which the session owns
+            await self._session.close()
+            self._session = None
+            self._connector = None
+        
     def cleanup(self):
         """Clean up resources"""
         self.stop_downloads()
-        self.executor.shutdown(wait=True)
+        
+        if self._loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=10)
+            except Exception as e:
+                self.logger.error(f"Error shutting down downloads: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=10)
+            self._loop = None
+            self._loop_thread = None
+            
+        if 'executor' in self.__dict__:
+            # Running yt-dlp downloads abort at their next progress hook now
+            # that their tasks are cancelled; queued ones are dropped unrun
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            del self.executor
 
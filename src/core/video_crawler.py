@@ -4,15 +4,45 @@ Video crawler for detecting video files from web pages
 """
 
 import re
-import requests
+import json
+import asyncio
+import functools
+import aiohttp
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
 from typing import List, Dict, Optional, Set
 import logging
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
+try:
+    # Optional C-backed parser; BeautifulSoup is used when it's missing
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # Optional faster JSON parser for ld+json metadata
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Browser User-Agent sent with every crawl and download request
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+# schema.org types whose ld+json entries carry video URLs, and those URL keys
+LD_JSON_VIDEO_TYPES = {'VideoObject', 'MediaObject'}
+LD_JSON_URL_KEYS = ('contentUrl', 'embedUrl', 'url')
+
+
+# Memoized URL helpers: extractors join the same hrefs against one base URL
+# and the classifiers reparse each candidate URL several times
+_urlparse = functools.lru_cache(maxsize=8192)(urlparse)
+_urljoin = functools.lru_cache(maxsize=8192)(urljoin)
+
 
 @dataclass
 class VideoInfo:
@@ -27,16 +57,42 @@ class VideoInfo:
     detected_by: str = ""
 
 
+class _SelectolaxElement:
+    """The slice of the BeautifulSoup Tag API the extractors use, over a selectolax node"""
+    
+    __slots__ = ('node', 'attrs')
+    
+    def __init__(self, node):
+        self.node = node
+        # lexbor reports valueless attributes (<video controls>) as None,
+        # where bs4 reports ''
+        self.attrs = {key: '' if value is None else value for key, value in node.attributes.items()}
+        
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+        
+    def __getitem__(self, key):
+        return self.attrs[key]
+        
+    def get_text(self, strip: bool = False) -> str:
+        return self.node.text(strip=strip)
+        
+    def find_all(self, name: str) -> List['_SelectolaxElement']:
+        return [_SelectolaxElement(node) for node in self.node.css(name)]
+        
+    @property
+    def string(self) -> str:
+        return self.node.text()
+
+
 class VideoCrawler:
     """Crawler for detecting video files from web pages"""
     
     def __init__(self, max_workers: int = 5, timeout: int = 30):
         self.max_workers = max_workers
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        # Created lazily inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
         
         # Video file extensions
         self.video_extensions = {
@@ -53,7 +109,8 @@ class VideoCrawler:
         
         # Video URL patterns
         self.video_patterns = [
-            r'https?://[^\s<>"\']+\.(?:mp4|avi|mkv|mov|wmv|flv|webm|m4v|3gp|ogv|ts)',
+            # The query string is kept, since signed CDN links need their token
+            r'https?://[^\s<>"\']+\.(?:mp4|avi|mkv|mov|wmv|flv|webm|m4v|3gp|ogv|ts)(?:\?[^\s<>"\']*)?',
             r'https?://[^\s<>"\']+/video/[^\s<>"\']+',
             r'https?://[^\s<>"\']+/media/[^\s<>"\']+',
             r'https?://[^\s<>"\']+/stream/[^\s<>"\']+',
@@ -61,20 +118,82 @@ class VideoCrawler:
             r'https?://[^\s<>"\']+/player/[^\s<>"\']+',
         ]
         
+        # Extraction runs each pattern separately, since they can match
+        # overlapping URLs in the same script
+        self._video_pattern_res = [re.compile(p, re.IGNORECASE) for p in self.video_patterns]
+        
+        # All video patterns as one alternation, for the yes/no check of
+        # whether a URL looks like a video
+        self._combined_video_re = re.compile('|'.join(f'(?:{p})' for p in self.video_patterns), re.IGNORECASE)
+        
+        # url(...) references in CSS
+        self._css_url_re = re.compile(r'url\(["\']?([^"\')\s]+)["\']?\)')
+        
         # Common video hosting platforms
         self.video_platforms = {
             'youtube.com', 'youtu.be', 'vimeo.com', 'dailymotion.com',
             'twitch.tv', 'facebook.com', 'instagram.com', 'tiktok.com'
         }
         
+        # Per-tag extractors used by the single pass in _extract_all
+        self._tag_handlers = {
+            'a': self._handle_link,
+            'video': self._handle_video,
+            'source': self._handle_source,
+            'object': self._handle_object,
+            'embed': self._handle_embed,
+            'script': self._handle_script,
+            'style': self._handle_style,
+            'iframe': self._handle_iframe,
+        }
+        
+        # Only the tags the extractors look at are kept when parsing a page
+        self._strainer = SoupStrainer(list(self._tag_handlers))
+        self._tag_selector = ', '.join(self._tag_handlers)
+        
+        # Tuples for single-call str.endswith checks; extensions are ordered
+        # longest first so e.g. '.m2ts' wins over '.ts'
+        self._video_ext_tuple = tuple(sorted(self.video_extensions, key=len, reverse=True))
+        self._platform_suffixes = tuple('.' + platform for platform in self.video_platforms)
+        
         self.logger = logging.getLogger(__name__)
         
-    def crawl_for_videos(self, url: str) -> List[VideoInfo]:
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, creating it on the running event loop"""
+        if self._session is None or self._session.closed:
+            # Kept open across crawls, so repeat visits to a host reuse its
+            # keep-alive connections and cached DNS
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=32,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT})
+        return self._session
+        
+    def crawl_for_videos_sync(self, url: str) -> List[VideoInfo]:
+        """
+        Crawl a website for video files from synchronous code
+        
+        Runs crawl_for_videos on a fresh event loop and closes the session
+        before returning.
+        """
+        async def crawl():
+            try:
+                return await self.crawl_for_videos(url)
+            finally:
+                await self.aclose()
+                
+        return asyncio.run(crawl())
+        
+    async def crawl_for_videos(self, url: str, strict: bool = False) -> List[VideoInfo]:
         """
         Crawl a website for video files
         
         Args:
             url: The website URL to crawl
+            strict: Also HEAD-check videos that have a known video extension
             
         Returns:
             List of detected video information
@@ -87,46 +206,23 @@ class VideoCrawler:
                 url = 'https://' + url
                 
             # Get the main page
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            base_url = response.url
-            
-            # Collect all potential video sources
-            videos = []
-            
-            # Method 1: Direct video file links
-            direct_videos = self._find_direct_video_links(soup, base_url)
-            videos.extend(direct_videos)
-            
-            # Method 2: Video tags
-            tag_videos = self._find_video_tags(soup, base_url)
-            videos.extend(tag_videos)
-            
-            # Method 3: Source tags
-            source_videos = self._find_source_tags(soup, base_url)
-            videos.extend(source_videos)
+            session = await self._get_session()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                response.raise_for_status()
+                content = await response.read()
+                base_url = str(response.url)
+                # Declared charset, if any; saves bs4 sniffing the whole body
+                encoding = response.charset
             
-            # Method 4: Object/embed tags
-            embed_videos = self._find_embed_videos(soup, base_url)
-            videos.extend(embed_videos)
+            # Collect all potential video sources in one pass over the page.
+            # Parsing is CPU-bound, so it runs in a worker thread to keep the
+            # event loop (the GUI thread under qasync) responsive
+            loop = asyncio.get_running_loop()
+            videos = await loop.run_in_executor(None, self._extract_page, content, encoding, base_url)
+            del content
             
-            # Method 5: JavaScript variables
-            js_videos = self._find_javascript_videos(soup, base_url)
-            videos.extend(js_videos)
-            
-            # Method 6: CSS background images (potential video thumbnails)
-            css_videos = self._find_css_videos(soup, base_url)
-            videos.extend(css_videos)
-            
-            # Method 7: Iframe sources
-            iframe_videos = self._find_iframe_videos(soup, base_url)
-            videos.extend(iframe_videos)
-            
-            # Remove duplicates and validate
-            unique_videos = self._deduplicate_videos(videos)
-            valid_videos = self._validate_videos(unique_videos)
+            # Extraction already skips duplicates; just validate
+            valid_videos = await self._validate_videos(videos, strict=strict)
             
             self.logger.info(f"Found {len(valid_videos)} valid videos")
             return valid_videos
@@ -135,36 +231,78 @@ class VideoCrawler:
             self.logger.error(f"Error crawling {url}: {e}")
             return []
     
-    def _find_direct_video_links(self, soup: BeautifulSoup, base_url: str) -> List[VideoInfo]:
-        """Find direct links to video files"""
+    def _extract_page(self, content: bytes, encoding: Optional[str], base_url: str) -> List[VideoInfo]:
+        """Parse a page and find its videos, with selectolax when it's installed"""
+        if LexborHTMLParser is not None:
+            try:
+                return self._extract_all(self._selectolax_elements(content, encoding), base_url)
+            except SelectolaxError as e:
+                self.logger.warning(f"selectolax failed on {base_url}, using BeautifulSoup: {e}")
+                
+        soup = BeautifulSoup(content, 'lxml', parse_only=self._strainer, from_encoding=encoding)
+        return self._extract_all(((getattr(element, 'name', None), element) for element in soup.descendants),
+                                 base_url)
+    
+    def _selectolax_elements(self, content: bytes, encoding: Optional[str]):
+        """Yield (tag name, element) for the extracted tags, in document order"""
+        tree = LexborHTMLParser(self._decode_page(content, encoding))
+        for node in tree.css(self._tag_selector):
+            yield node.tag, _SelectolaxElement(node)
+    
+    @staticmethod
+    def _decode_page(content: bytes, encoding: Optional[str]) -> str:
+        """Decode a page for lexbor: BOM, declared charset, <meta charset>, then UTF-8"""
+        content, bom_encoding = EncodingDetector.strip_byte_order_mark(content)
+        # Browsers only look for <meta charset> in the first 1024 bytes
+        meta_encoding = EncodingDetector.find_declared_encoding(content[:1024], is_html=True)
+        for candidate in (bom_encoding, encoding, meta_encoding):
+            if candidate:
+                try:
+                    return content.decode(candidate, 'replace')
+                except LookupError:
+                    # Unknown label, or a bytes-only codec such as base64
+                    pass
+        return content.decode('utf-8', 'replace')
+    
+    def _extract_all(self, elements, base_url: str) -> List[VideoInfo]:
+        """Find all potential videos with a single traversal of the page"""
         videos = []
+        # URLs already found; handlers skip these before building a VideoInfo
+        seen: Set[str] = set()
         
-        # Find all links
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            full_url = urljoin(base_url, href)
-            
-            # Check if it's a video file
-            if self._is_video_url(full_url):
-                title = link.get_text(strip=True) or self._extract_title_from_url(full_url)
-                videos.append(VideoInfo(
-                    url=full_url,
-                    title=title,
-                    file_type=self._get_file_extension(full_url),
-                    source_page=base_url,
-                    detected_by="direct_link"
-                ))
+        for name, element in elements:
+            handler = self._tag_handlers.get(name)
+            if handler:
+                handler(element, base_url, videos, seen)
         
         return videos
     
-    def _find_video_tags(self, soup: BeautifulSoup, base_url: str) -> List[VideoInfo]:
-        """Find video tags"""
-        videos = []
-        
-        for video in soup.find_all('video'):
-            # Check src attribute
-            if video.get('src'):
-                src = urljoin(base_url, video['src'])
+    def _handle_link(self, link, base_url: str, videos: List[VideoInfo], seen: Set[str]):
+        """Direct links to video files"""
+        href = link.get('href')
+        if href is None:
+            return
+        full_url = _urljoin(base_url, href)
+        
+        # Check if it's a video file
+        if full_url not in seen and self._is_video_url(full_url):
+            seen.add(full_url)
+            title = link.get_text(strip=True) or self._extract_title_from_url(full_url)
+            videos.append(VideoInfo(
+                url=full_url,
+                title=title,
+                file_type=self._get_file_extension(full_url),
+                source_page=base_url,
+                detected_by="direct_link"
+            ))
+    
+    def _handle_video(self, video, base_url: str, videos: List[VideoInfo], seen: Set[str]):
+        """Video tags and the source tags nested in them"""
+        # Check src attribute
+        if video.get('src'):
+            src = _urljoin(base_url, video['src'])
+            if src not in seen:
+                seen.add(src)
                 title = video.get('title') or video.get('alt') or "Video"
                 videos.append(VideoInfo(
                     url=src,
@@ -173,182 +311,207 @@ class VideoCrawler:
                     source_page=base_url,
                     detected_by="video_tag"
                 ))
-            
-            # Check source tags
-            for source in video.find_all('source'):
-                if source.get('src'):
-                    src = urljoin(base_url, source['src'])
-                    title = source.get('title') or video.get('title') or "Video"
-                    videos.append(VideoInfo(
-                        url=src,
-                        title=title,
-                        file_type=self._get_file_extension(src),
-                        source_page=base_url,
-                        detected_by="video_source_tag"
-                    ))
         
-        return videos
-    
-    def _find_source_tags(self, soup: BeautifulSoup, base_url: str) -> List[VideoInfo]:
-        """Find source tags that might contain videos"""
-        videos = []
-        
-        for source in soup.find_all('source'):
+        # Check source tags
+        for source in video.find_all('source'):
             if source.get('src'):
-                src = urljoin(base_url, source['src'])
-                if self._is_video_url(src):
-                    title = source.get('title') or "Video Source"
-                    videos.append(VideoInfo(
-                        url=src,
-                        title=title,
-                        file_type=self._get_file_extension(src),
-                        source_page=base_url,
-                        detected_by="source_tag"
-                    ))
-        
-        return videos
+                src = _urljoin(base_url, source['src'])
+                if src in seen:
+                    continue
+                seen.add(src)
+                title = source.get('title') or video.get('title') or "Video"
+                videos.append(VideoInfo(
+                    url=src,
+                    title=title,
+                    file_type=self._get_file_extension(src),
+                    source_page=base_url,
+                    detected_by="video_source_tag"
+                ))
     
-    def _find_embed_videos(self, soup: BeautifulSoup, base_url: str) -> List[VideoInfo]:
-        """Find embedded videos in object and embed tags"""
-        videos = []
-        
-        # Object tags
-        for obj in soup.find_all('object'):
-            if obj.get('data'):
-                data = urljoin(base_url, obj['data'])
-                if self._is_video_url(data):
-                    title = obj.get('title') or "Embedded Video"
-                    videos.append(VideoInfo(
-                        url=data,
-                        title=title,
-                        file_type=self._get_file_extension(data),
-                        source_page=base_url,
-                        detected_by="object_tag"
-                    ))
-        
-        # Embed tags
-        for embed in soup.find_all('embed'):
-            if embed.get('src'):
-                src = urljoin(base_url, embed['src'])
-                if self._is_video_url(src):
-                    title = embed.get('title') or "Embedded Video"
-                    videos.append(VideoInfo(
-                        url=src,
-                        title=title,
-                        file_type=self._get_file_extension(src),
-                        source_page=base_url,
-                        detected_by="embed_tag"
-                    ))
-        
-        return videos
+    def _handle_source(self, source, base_url: str, videos: List[VideoInfo], seen: Set[str]):
+        """Source tags that might contain videos"""
+        if source.get('src'):
+            src = _urljoin(base_url, source['src'])
+            if src not in seen and self._is_video_url(src):
+                seen.add(src)
+                title = source.get('title') or "Video Source"
+                videos.append(VideoInfo(
+                    url=src,
+                    title=title,
+                    file_type=self._get_file_extension(src),
+                    source_page=base_url,
+                    detected_by="source_tag"
+                ))
     
-    def _find_javascript_videos(self, soup: BeautifulSoup, base_url: str) -> List[VideoInfo]:
-        """Find video URLs in JavaScript code"""
-        videos = []
-        
-        # Look for script tags
-        for script in soup.find_all('script'):
-            if script.string:
-                # Find video URLs in JavaScript
-                for pattern in self.video_patterns:
-                    matches = re.findall(pattern, script.string, re.IGNORECASE)
-                    for match in matches:
-                        full_url = urljoin(base_url, match)
-                        if self._is_video_url(full_url):
-                            videos.append(VideoInfo(
-                                url=full_url,
-                                title=self._extract_title_from_url(full_url),
-                                file_type=self._get_file_extension(full_url),
-                                source_page=base_url,
-                                detected_by="javascript"
-                            ))
-        
-        return videos
+    def _handle_object(self, obj, base_url: str, videos: List[VideoInfo], seen: Set[str]):
+        """Videos embedded with object tags"""
+        if obj.get('data'):
+            data = _urljoin(base_url, obj['data'])
+            if data not in seen and self._is_video_url(data):
+                seen.add(data)
+                title = obj.get('title') or "Embedded Video"
+                videos.append(VideoInfo(
+                    url=data,
+                    title=title,
+                    file_type=self._get_file_extension(data),
+                    source_page=base_url,
+                    detected_by="object_tag"
+                ))
     
-    def _find_css_videos(self, soup: BeautifulSoup, base_url: str) -> List[VideoInfo]:
-        """Find potential video URLs in CSS"""
-        videos = []
-        
-        # Look for style tags
-        for style in soup.find_all('style'):
-            if style.string:
-                # Find URLs in CSS
-                url_pattern = r'url\(["\']?([^"\')\s]+)["\']?\)'
-                matches = re.findall(url_pattern, style.string)
-                for match in matches:
-                    full_url = urljoin(base_url, match)
-                    if self._is_video_url(full_url):
+    def _handle_embed(self, embed, base_url: str, videos: List[VideoInfo], seen: Set[str]):
+        """Videos embedded with embed tags"""
+        if embed.get('src'):
+            src = _urljoin(base_url, embed['src'])
+            if src not in seen and self._is_video_url(src):
+                seen.add(src)
+                title = embed.get('title') or "Embedded Video"
+                videos.append(VideoInfo(
+                    url=src,
+                    title=title,
+                    file_type=self._get_file_extension(src),
+                    source_page=base_url,
+                    detected_by="embed_tag"
+                ))
+    
+    def _handle_script(self, script, base_url: str, videos: List[VideoInfo], seen: Set[str]):
+        """Video URLs in JavaScript code"""
+        if script.get('type', '').lower() == 'application/ld+json' and script.string:
+            try:
+                # str() since bs4 hands back a NavigableString, which orjson rejects
+                data = _json_loads(str(script.string))
+            except ValueError:
+                pass  # Malformed metadata; scan it as plain text below
+            else:
+                self._handle_ld_json(data, base_url, videos, seen)
+                return
+                
+        if script.string:
+            # Find video URLs in JavaScript
+            for pattern in self._video_pattern_res:
+                for m in pattern.finditer(script.string):
+                    full_url = _urljoin(base_url, m.group(0))
+                    if full_url not in seen and self._is_video_url(full_url):
+                        seen.add(full_url)
                         videos.append(VideoInfo(
                             url=full_url,
                             title=self._extract_title_from_url(full_url),
                             file_type=self._get_file_extension(full_url),
                             source_page=base_url,
-                            detected_by="css"
+                            detected_by="javascript"
                         ))
-        
-        return videos
     
-    def _find_iframe_videos(self, soup: BeautifulSoup, base_url: str) -> List[VideoInfo]:
-        """Find videos in iframe sources"""
-        videos = []
-        
-        for iframe in soup.find_all('iframe'):
-            if iframe.get('src'):
-                src = urljoin(base_url, iframe['src'])
+    def _handle_ld_json(self, data, base_url: str, videos: List[VideoInfo], seen: Set[str]):
+        """Video URLs in schema.org VideoObject/MediaObject metadata"""
+        # Walk the decoded JSON without recursion; entries nest in @graph,
+        # lists and properties such as "video"
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(reversed(item))
+                continue
+            if not isinstance(item, dict):
+                continue
                 
-                # Check if it's a video platform
-                if self._is_video_platform(src):
-                    title = iframe.get('title') or "Embedded Video"
+            types = item.get('@type')
+            if isinstance(types, str):
+                types = [types]
+            if isinstance(types, list) and not LD_JSON_VIDEO_TYPES.isdisjoint(types):
+                for key in LD_JSON_URL_KEYS:
+                    url = item.get(key)
+                    if not isinstance(url, str) or not url:
+                        continue
+                    full_url = _urljoin(base_url, url)
+                    if full_url in seen:
+                        continue
+                    seen.add(full_url)
+                    file_type = self._get_file_extension(full_url)
+                    if file_type == "unknown" and self._is_video_platform(full_url):
+                        file_type = "embedded"
+                    name = item.get('name')
                     videos.append(VideoInfo(
-                        url=src,
-                        title=title,
-                        file_type="embedded",
+                        url=full_url,
+                        title=name if isinstance(name, str) and name else self._extract_title_from_url(full_url),
+                        file_type=file_type,
                         source_page=base_url,
-                        detected_by="iframe"
+                        detected_by="json_ld"
                     ))
-        
-        return videos
+                    
+            stack.extend(reversed([value for value in item.values() if isinstance(value, (dict, list))]))
+    
+    def _handle_style(self, style, base_url: str, videos: List[VideoInfo], seen: Set[str]):
+        """Potential video URLs in CSS"""
+        if style.string:
+            # Find URLs in CSS
+            for match in self._css_url_re.findall(style.string):
+                full_url = _urljoin(base_url, match)
+                if full_url not in seen and self._is_video_url(full_url):
+                    seen.add(full_url)
+                    videos.append(VideoInfo(
+                        url=full_url,
+                        title=self._extract_title_from_url(full_url),
+                        file_type=self._get_file_extension(full_url),
+                        source_page=base_url,
+                        detected_by="css"
+                    ))
+    
+    def _handle_iframe(self, iframe, base_url: str, videos: List[VideoInfo], seen: Set[str]):
+        """Videos in iframe sources"""
+        if iframe.get('src'):
+            src = _urljoin(base_url, iframe['src'])
+            
+            # Check if it's a video platform
+            if src not in seen and self._is_video_platform(src):
+                seen.add(src)
+                title = iframe.get('title') or "Embedded Video"
+                videos.append(VideoInfo(
+                    url=src,
+                    title=title,
+                    file_type="embedded",
+                    source_page=base_url,
+                    detected_by="iframe"
+                ))
     
     def _is_video_url(self, url: str) -> bool:
         """Check if a URL points to a video file"""
-        parsed = urlparse(url)
+        parsed = _urlparse(url)
         
         # Check file extension
-        if any(parsed.path.lower().endswith(ext) for ext in self.video_extensions):
+        if parsed.path.lower().endswith(self._video_ext_tuple):
             return True
         
         # Check for video patterns in URL
-        for pattern in self.video_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
-        
-        return False
+        return self._combined_video_re.search(url) is not None
     
     def _is_video_platform(self, url: str) -> bool:
         """Check if URL is from a known video platform"""
-        parsed = urlparse(url)
-        return any(platform in parsed.netloc.lower() for platform in self.video_platforms)
+        # Match the host or any of its parent domains, e.g. www.youtube.com
+        host = _urlparse(url).hostname or ''
+        return host in self.video_platforms or host.endswith(self._platform_suffixes)
     
     def _get_file_extension(self, url: str) -> str:
         """Extract file extension from URL"""
-        parsed = urlparse(url)
+        parsed = _urlparse(url)
         path = parsed.path.lower()
         
-        for ext in self.video_extensions:
-            if path.endswith(ext):
-                return ext
+        if path.endswith(self._video_ext_tuple):
+            for ext in self._video_ext_tuple:
+                if path.endswith(ext):
+                    return ext
         
         return "unknown"
     
     def _extract_title_from_url(self, url: str) -> str:
         """Extract a title from URL"""
-        parsed = urlparse(url)
+        parsed = _urlparse(url)
         path = parsed.path
         
         # Remove file extension
-        for ext in self.video_extensions:
-            if path.endswith(ext):
-                path = path[:-len(ext)]
+        if path.endswith(self._video_ext_tuple):
+            for ext in self._video_ext_tuple:
+                if path.endswith(ext):
+                    path = path[:-len(ext)]
+                    break
         
         # Clean up the path
         title = path.split('/')[-1]
@@ -369,15 +532,27 @@ class VideoCrawler:
         
         return unique_videos
     
-    def _validate_videos(self, videos: List[VideoInfo]) -> List[VideoInfo]:
+    async def _validate_videos(self, videos: List[VideoInfo], strict: bool = False) -> List[VideoInfo]:
         """Validate video URLs by checking if they're accessible"""
-        valid_videos = []
-        
-        def validate_video(video: VideoInfo) -> Optional[VideoInfo]:
-            try:
-                # Quick HEAD request to check if URL is accessible
-                response = self.session.head(video.url, timeout=10, allow_redirects=True)
-                if response.status_code == 200:
+        # A URL with a known video extension (file_type '.mp4' etc.) is
+        # trusted as-is unless strict; everything else, including iframe and
+        # ld+json embeds, still gets a HEAD round-trip
+        needs_check = videos if strict else [video for video in videos if not video.file_type.startswith('.')]
+        
+        # Bound the number of HEAD requests in flight at once
+        semaphore = asyncio.Semaphore(self.max_workers)
+        results = await asyncio.gather(*[self._validate_video(video, semaphore) for video in needs_check])
+        passed = {id(video) for video in results if video}
+        return [video for video in videos
+                if id(video) in passed or (not strict and video.file_type.startswith('.'))]
+        
+    async def _validate_video(self, video: VideoInfo, semaphore: asyncio.Semaphore) -> Optional[VideoInfo]:
+        """Validate a single video URL with a quick HEAD request"""
+        try:
+            session = await self._get_session()
+            async with semaphore, session.head(video.url, timeout=aiohttp.ClientTimeout(total=10),
+                                               allow_redirects=True) as response:
+                if response.status == 200:
                     # Check if it's actually a video
                     content_type = response.headers.get('content-type', '')
                     if any(video_type in content_type.lower() for video_type in ['video', 'stream']):
@@ -385,36 +560,36 @@ class VideoCrawler:
                     elif video.file_type != "unknown":
                         return video
                 return None
-            except Exception:
-                return None
-        
-        # Use ThreadPoolExecutor for concurrent validation
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_video = {executor.submit(validate_video, video): video for video in videos}
-            
-            for future in as_completed(future_to_video):
-                result = future.result()
-                if result:
-                    valid_videos.append(result)
-        
-        return valid_videos
+        except Exception:
+            return None
     
-    def crawl_multiple_pages(self, urls: List[str]) -> List[VideoInfo]:
+    async def crawl_multiple_pages(self, urls: List[str]) -> List[VideoInfo]:
         """Crawl multiple pages for videos"""
         all_videos = []
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_url = {executor.submit(self.crawl_for_videos, url): url for url in urls}
-            
-            for future in as_completed(future_to_url):
-                try:
-                    videos = future.result()
-                    all_videos.extend(videos)
-                except Exception as e:
-                    self.logger.error(f"Error crawling {future_to_url[future]}: {e}")
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def crawl(url: str) -> List[VideoInfo]:
+            async with semaphore:
+                return await self.crawl_for_videos(url)
+                
+        results = await asyncio.gather(*[crawl(url) for url in urls], return_exceptions=True)
+        for url, videos in zip(urls, results):
+            if isinstance(videos, Exception):
+                self.logger.error(f"Error crawling {url}: {videos}")
+            else:
+                all_videos.extend(videos)
         
         return self._deduplicate_videos(all_videos)
     
-    def close(self):
+    async def aclose(self):
         """Close the session"""
-        self.session.close()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def close(self):
+        """Close the session (from synchronous code, outside any event loop)"""
+        if self._session is not None and not self._session.closed:
+            asyncio.run(self.aclose())
+        self._session = None
@@ -4,14 +4,18 @@ Main window for the Bulk Video Downloader application
 """
 
 import os
+import time
+import asyncio
+import logging
+import threading
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QLabel, QLineEdit, QPushButton, QTextEdit, 
+    QLabel, QLineEdit, QPushButton, QPlainTextEdit, 
     QProgressBar, QFileDialog, QGroupBox, QGridLayout,
     QSpinBox, QCheckBox, QComboBox, QMessageBox,
-    QSplitter, QListWidget, QListWidgetItem
+    QSplitter, QListWidget
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QThreadPool, QRunnable, QObject
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QTimer, QObject, QEvent
 from PyQt6.QtGui import QFont, QIcon, QPixmap
 import sys
 import os
@@ -23,39 +27,64 @@ from core.video_crawler import VideoCrawler, VideoInfo
 from core.download_manager import DownloadManager, DownloadTask, DownloadStatus, DownloadProgressCallback
 
 
-class CrawlSignals(QObject):
-    """Signals for the crawler worker"""
-    finished = pyqtSignal(list)  # Emits list of videos
-    error = pyqtSignal(str)      # Emits error message
+# Progress updates reach the UI at most once per task per this many ms
+PROGRESS_THROTTLE_MS = 200
 
+# Overall progress and stats are redrawn at most once per this many ms
+STATS_THROTTLE_MS = 250
 
-class DownloadSignals(QObject):
-    """Signals for download progress updates"""
-    progress_update = pyqtSignal(object)  # Emits DownloadTask
-    download_complete = pyqtSignal(object)  # Emits DownloadTask
-    download_error = pyqtSignal(object, str)  # Emits DownloadTask and error
-    status_change = pyqtSignal(object, str, str)  # Emits DownloadTask, old_status, new_status
+# Fallback stats refresh interval while downloads are running
+PROGRESS_TIMER_MS = 1000
 
+# Status log lines are batched and written once per this many ms, and only
+# the most recent LOG_MAX_LINES are kept
+LOG_FLUSH_MS = 200
+LOG_MAX_LINES = 500
 
-class CrawlWorker(QRunnable):
-    """Worker for crawling videos in background"""
-    
-    def __init__(self, url: str):
-        super().__init__()
-        self.url = url
-        self.signals = CrawlSignals()
-        
-    def run(self):
-        """Run the crawling operation"""
-        try:
-            crawler = VideoCrawler()
-            videos = crawler.crawl_for_videos(self.url)
-            crawler.close()
-            # Emit the finished signal with the videos
-            self.signals.finished.emit(videos)
-        except Exception as e:
-            # Emit the error signal with the error message
-            self.signals.error.emit(str(e))
+# The download folder is created once typing in its field pauses this long
+FOLDER_DEBOUNCE_MS = 300
+
+
+# Application stylesheet, parsed once at startup; buttons pick up their
+# style through their object names
+APP_STYLESHEET = """
+    QPushButton#crawl {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton#crawl:hover {
+        background-color: #45a049;
+    }
+    QPushButton#crawl:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton#start {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton#start:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#start:pressed {
+        background-color: #1565C0;
+    }
+"""
+
+
+# Download event types carried by DownloadSignals.update
+EVT_PROGRESS, EVT_COMPLETE, EVT_ERROR, EVT_STATUS = range(4)
+
+
+class DownloadSignals(QObject):
+    """Signals for download progress updates"""
+    update = pyqtSignal(int, object, object)  # Emits event type, DownloadTask and event data
+    progress_pending = pyqtSignal()  # Throttled progress is waiting to be flushed
 
 
 class MainWindow(QMainWindow, DownloadProgressCallback):
@@ -68,22 +97,58 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         self.video_crawler = None
         self.detected_videos = []
         self.download_manager = None
+        # Running crawls, as asyncio tasks on the Qt event loop
+        self._crawl_tasks = set()
         
         # Thread safety - use Qt signals instead of locks
         self._download_signals = DownloadSignals()
         
+        # Download folder changes are applied once typing pauses
+        self._created_folder = None
+        self._folder_debounce = QTimer(self)
+        self._folder_debounce.setSingleShot(True)
+        self._folder_debounce.setInterval(FOLDER_DEBOUNCE_MS)
+        self._folder_debounce.timeout.connect(self._apply_download_folder)
+        
+        # Status log lines waiting for the next batched write, and the last
+        # formatted timestamp as (epoch second, "HH:MM:SS")
+        self._pending_logs = []
+        self._timestamp_cache = (None, "")
+        # Per-task status transitions are only logged at DEBUG
+        self._log_level = logging.INFO
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        
+        # Latest progress per task id, flushed to the UI by a single-shot
+        # timer so fast downloads don't flood the GUI thread with events.
+        # on_progress also runs on yt-dlp worker threads, hence the lock
+        self._progress_lock = threading.Lock()
+        self._latest_progress = {}
+        self._progress_flush_scheduled = False
+        self._progress_throttle = QTimer(self)
+        self._progress_throttle.setSingleShot(True)
+        self._progress_throttle.setInterval(PROGRESS_THROTTLE_MS)
+        self._progress_throttle.timeout.connect(self._flush_progress)
+        self._download_signals.progress_pending.connect(self._progress_throttle.start,
+                                                        Qt.ConnectionType.QueuedConnection)
+        
         self.setup_ui()
         self.setup_connections()
         self.setup_download_manager()
         
-        # Setup thread pool for background operations
-        self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(5)
+        # Progress bars and stats are redrawn from download events, at most
+        # once per throttle window
+        self._stats_throttle = QTimer(self)
+        self._stats_throttle.setSingleShot(True)
+        self._stats_throttle.setInterval(STATS_THROTTLE_MS)
+        self._stats_throttle.timeout.connect(self.update_progress_bars)
         
-        # Timer for updating progress bars
-        self.progress_timer = QTimer()
+        # Fallback refresh, only running while downloads are in progress
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(PROGRESS_TIMER_MS)
         self.progress_timer.timeout.connect(self.update_progress_bars)
-        self.progress_timer.start(1000)  # Update every 1000ms to reduce race conditions
         
     def setup_download_manager(self):
         """Setup the download manager"""
@@ -96,12 +161,19 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         )
         self.download_manager.set_callback(self)
         
-        # Connect download signals to UI updates
-        self._download_signals.progress_update.connect(self._handle_progress_update)
-        self._download_signals.download_complete.connect(self._handle_download_complete)
-        self._download_signals.download_error.connect(self._handle_download_error)
-        self._download_signals.status_change.connect(self._handle_status_change)
-        
+        # One crawler for the window's lifetime, so its HTTP session keeps
+        # connections (and TLS sessions) alive across crawls
+        self.video_crawler = VideoCrawler()
+        
+        # Download events arrive from the download threads; queue them onto
+        # the GUI thread and dispatch them from one slot
+        self._download_event_handlers = {
+            EVT_PROGRESS: self._handle_progress_update,
+            EVT_COMPLETE: self._handle_download_complete,
+            EVT_ERROR: self._handle_download_error,
+            EVT_STATUS: self._handle_status_change,
+        }
+        self._download_signals.update.connect(self._handle_download_event, Qt.ConnectionType.QueuedConnection)
 
         
 
@@ -140,21 +212,7 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         self.crawl_button = QPushButton("Crawl for Videos")
         self.crawl_button.setMinimumHeight(35)
         self.crawl_button.setMinimumWidth(120)
-        self.crawl_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        self.crawl_button.setObjectName("crawl")
         
         url_input_layout.addWidget(url_label)
         url_input_layout.addWidget(self.url_input)
@@ -190,6 +248,10 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         settings_layout.addWidget(concurrent_label, 1, 0)
         settings_layout.addWidget(self.concurrent_spinbox, 1, 1)
         
+        # Verbose status log
+        self.verbose_log_checkbox = QCheckBox("Log every download status change")
+        settings_layout.addWidget(self.verbose_log_checkbox, 2, 1)
+        
 
         
 
@@ -244,9 +306,10 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         progress_layout.addLayout(stats_layout)
         
         # Status text
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setMaximumHeight(100)
         self.status_text.setReadOnly(True)
+        self.status_text.setMaximumBlockCount(LOG_MAX_LINES)
         self.status_text.setPlaceholderText("Status messages will appear here...")
         
         progress_layout.addWidget(self.status_text)
@@ -255,21 +318,7 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         download_buttons_layout = QHBoxLayout()
         self.start_download_button = QPushButton("Start Download")
         self.start_download_button.setMinimumHeight(35)
-        self.start_download_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #1565C0;
-            }
-        """)
+        self.start_download_button.setObjectName("start")
         
         self.pause_download_button = QPushButton("Pause")
         self.pause_download_button.setMinimumHeight(35)
@@ -295,26 +344,31 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         
     def setup_connections(self):
         """Setup signal connections"""
+        # Widget signals are emitted on the GUI thread, so their slots can be
+        # called directly without the per-emit thread-affinity check
+        direct = Qt.ConnectionType.DirectConnection
+        
         # URL input
-        self.crawl_button.clicked.connect(self.crawl_for_videos)
-        self.url_input.returnPressed.connect(self.crawl_for_videos)
+        self.crawl_button.clicked.connect(self.crawl_for_videos, direct)
+        self.url_input.returnPressed.connect(self.crawl_for_videos, direct)
         
         # Folder selection
-        self.browse_button.clicked.connect(self.browse_folder)
+        self.browse_button.clicked.connect(self.browse_folder, direct)
         
         # Video list
-        self.select_all_button.clicked.connect(self.select_all_videos)
-        self.clear_selection_button.clicked.connect(self.clear_video_selection)
-        self.refresh_list_button.clicked.connect(self.refresh_video_list)
+        self.select_all_button.clicked.connect(self.select_all_videos, direct)
+        self.clear_selection_button.clicked.connect(self.clear_video_selection, direct)
+        self.refresh_list_button.clicked.connect(self.refresh_video_list, direct)
         
         # Download controls
-        self.start_download_button.clicked.connect(self.start_download)
-        self.pause_download_button.clicked.connect(self.pause_download)
-        self.stop_download_button.clicked.connect(self.stop_download)
+        self.start_download_button.clicked.connect(self.start_download, direct)
+        self.pause_download_button.clicked.connect(self.pause_download, direct)
+        self.stop_download_button.clicked.connect(self.stop_download, direct)
         
         # Settings changes
-        self.concurrent_spinbox.valueChanged.connect(self.on_concurrent_changed)
-        self.folder_input.textChanged.connect(self.on_folder_changed)
+        self.concurrent_spinbox.valueChanged.connect(self.on_concurrent_changed, direct)
+        self.folder_input.textChanged.connect(self.on_folder_changed, direct)
+        self.verbose_log_checkbox.toggled.connect(self.on_verbose_log_changed, direct)
         
 
         
@@ -323,11 +377,27 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         if self.download_manager:
             self.download_manager.max_concurrent = value
             
+    def on_verbose_log_changed(self, checked):
+        """Handle verbose log setting change"""
+        self._log_level = logging.DEBUG if checked else logging.INFO
+        
     def on_folder_changed(self, text):
         """Handle download folder setting change"""
+        # Restart the debounce; edits fire on every keystroke
+        self._folder_debounce.start()
+        
+    @pyqtSlot()
+    def _apply_download_folder(self):
+        """Point the download manager at the folder field's path, creating it"""
         if self.download_manager:
-            self.download_manager.download_folder = os.path.expanduser(text)
-            os.makedirs(self.download_manager.download_folder, exist_ok=True)
+            folder = os.path.expanduser(self.folder_input.text())
+            self.download_manager.download_folder = folder
+            if folder != self._created_folder:
+                try:
+                    os.makedirs(folder, exist_ok=True)
+                    self._created_folder = folder
+                except OSError as e:
+                    print(f"Folder creation error: {e}")
         
 
             
@@ -361,14 +431,27 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         self.crawl_button.setEnabled(False)
         self.crawl_button.setText("Crawling...")
         
-        # Create and run crawler worker
-        worker = CrawlWorker(url)
-        
-        # Connect signals from the worker to the main window
-        worker.signals.finished.connect(self.on_crawl_complete)
-        worker.signals.error.connect(self.on_crawl_error)
+        # Crawl as a coroutine on the Qt event loop (qasync); the HTTP
+        # requests wait without tying up a thread
+        task = asyncio.ensure_future(self._crawl_async(url))
+        self._crawl_tasks.add(task)
+        task.add_done_callback(self._crawl_tasks.discard)
+        task.add_done_callback(self._on_crawl_done)
         
-        self.thread_pool.start(worker)
+    async def _crawl_async(self, url: str):
+        """Crawl a URL for videos"""
+        return await self.video_crawler.crawl_for_videos(url)
+            
+    def _on_crawl_done(self, task):
+        """Hand a finished crawl to the completion or error handler"""
+        if task.cancelled():
+            return
+        try:
+            videos = task.result()
+        except Exception as e:
+            self.on_crawl_error(str(e))
+        else:
+            self.on_crawl_complete(videos)
         
     def on_crawl_complete(self, videos):
         """Handle crawl completion"""
@@ -399,17 +482,25 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         
     def update_video_list(self, videos):
         """Update the video list with detected videos"""
-        self.video_list.clear()
-        
-        for video in videos:
-            # Create a descriptive item text
-            item_text = f"{video.title} ({video.file_type})"
-            if video.detected_by:
-                item_text += f" - {video.detected_by}"
+        # Fill the list with repaints off, so it is laid out and drawn once
+        self.video_list.setUpdatesEnabled(False)
+        try:
+            self.video_list.clear()
+            
+            # Create descriptive item texts
+            item_texts = []
+            for video in videos:
+                item_text = f"{video.title} ({video.file_type})"
+                if video.detected_by:
+                    item_text += f" - {video.detected_by}"
+                item_texts.append(item_text)
                 
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, video)  # Store video object
-            self.video_list.addItem(item)
+            # addItems inserts every row in a single model operation
+            self.video_list.addItems(item_texts)
+            for row, video in enumerate(videos):
+                self.video_list.item(row).setData(Qt.ItemDataRole.UserRole, video)  # Store video object
+        finally:
+            self.video_list.setUpdatesEnabled(True)
             
     def browse_folder(self):
         """Browse for download folder"""
@@ -422,8 +513,8 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
             
     def select_all_videos(self):
         """Select all videos in the list"""
-        for i in range(self.video_list.count()):
-            self.video_list.item(i).setSelected(True)
+        # One selection change for the whole list instead of one per row
+        self.video_list.selectAll()
             
     def clear_video_selection(self):
         """Clear video selection"""
@@ -452,6 +543,11 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         if not selected_videos:
             return
             
+        # Apply a folder edit still waiting out its debounce
+        if self._folder_debounce.isActive():
+            self._folder_debounce.stop()
+            self._apply_download_folder()
+            
         # Add videos to download manager
         self.download_manager.add_multiple_downloads(selected_videos)
         
@@ -462,6 +558,8 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         self.start_download_button.setEnabled(False)
         self.pause_download_button.setEnabled(True)
         self.stop_download_button.setEnabled(True)
+        self.progress_timer.start()
+        self.update_progress_bars()
         
         self.log_status(f"Started downloading {len(selected_videos)} videos")
         self.statusBar().showMessage(f"Downloading {len(selected_videos)} videos...")
@@ -479,12 +577,16 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
             self.download_manager.stop_downloads()
             self.log_status("Downloads stopped")
             
+        self.progress_timer.stop()
+        self.update_progress_bars()
+        
         # Reset UI state
         self.start_download_button.setEnabled(True)
         self.pause_download_button.setEnabled(False)
         self.pause_download_button.setText("Pause")
         self.stop_download_button.setEnabled(False)
         
+    @pyqtSlot()
     def update_progress_bars(self):
         """Update progress bars with current download status"""
         try:
@@ -501,10 +603,62 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
             stats = self.download_manager.get_download_stats()
             stats_text = f"Total: {stats['total']} | Completed: {stats['completed']} | Failed: {stats['failed']} | Active: {stats['active']} | Pending: {stats['pending']}"
             self.stats_label.setText(stats_text)
+            
+            # Completion events can race the manager's bookkeeping, so the
+            # fallback timer also checks whether the run has finished
+            self._downloads_idle()
         except Exception as e:
             # Log any errors but don't crash
             print(f"Progress update error: {e}")
     
+    @pyqtSlot(int, object, object)
+    def _handle_download_event(self, event_type: int, task: DownloadTask, data):
+        """Dispatch a download event to its handler and schedule a stats redraw"""
+        handler = self._download_event_handlers[event_type]
+        if data is None:
+            handler(task)
+        elif event_type == EVT_STATUS:
+            handler(task, *data)
+        else:
+            handler(task, data)
+        self._schedule_stats_refresh()
+    
+    def _schedule_stats_refresh(self):
+        """Redraw progress bars and stats once the throttle window ends"""
+        if not self._stats_throttle.isActive():
+            self._stats_throttle.start()
+            
+    def _downloads_idle(self) -> bool:
+        """Reset the UI once nothing is active or pending"""
+        if self.download_manager.get_active_tasks() or self.download_manager.get_pending_tasks():
+            return False
+        if self.progress_timer.isActive():
+            # Only the first caller after the last download reports it
+            self.progress_timer.stop()
+            self.log_status("All downloads completed!")
+            self.statusBar().showMessage("All downloads completed")
+            
+            # Reset UI state
+            self.start_download_button.setEnabled(True)
+            self.pause_download_button.setEnabled(False)
+            self.pause_download_button.setText("Pause")
+            self.stop_download_button.setEnabled(False)
+        return True
+    
+    @pyqtSlot()
+    def _flush_progress(self):
+        """Handle the latest progress of each task updated since the last flush"""
+        try:
+            # Swap and re-arm together, so an update arriving after the swap
+            # schedules another flush instead of being dropped
+            with self._progress_lock:
+                self._progress_flush_scheduled = False
+                pending, self._latest_progress = self._latest_progress, {}
+            for task in pending.values():
+                self._handle_download_event(EVT_PROGRESS, task, None)
+        except Exception as e:
+            print(f"Progress flush error: {e}")
+    
     def _handle_progress_update(self, task: DownloadTask):
         """Handle progress update from signal"""
         try:
@@ -517,16 +671,7 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         try:
             self.log_status(f"Completed: {task.video_info.title}")
             
-            # Check if all downloads are done
-            if not self.download_manager.get_active_tasks() and not self.download_manager.get_pending_tasks():
-                self.log_status("All downloads completed!")
-                self.statusBar().showMessage("All downloads completed")
-                
-                # Reset UI state
-                self.start_download_button.setEnabled(True)
-                self.pause_download_button.setEnabled(False)
-                self.pause_download_button.setText("Pause")
-                self.stop_download_button.setEnabled(False)
+            self._downloads_idle()
         except Exception as e:
             print(f"Complete handler error: {e}")
     
@@ -534,11 +679,14 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         """Handle download error from signal"""
         try:
             self.log_status(f"Error downloading {task.video_info.title}: {error}")
+            self._downloads_idle()
         except Exception as e:
             print(f"Error handler error: {e}")
     
     def _handle_status_change(self, task: DownloadTask, old_status: str, new_status: str):
         """Handle status change from signal"""
+        if self._log_level > logging.DEBUG:
+            return
         try:
             self.log_status(f"Status change: {task.video_info.title} - {old_status} → {new_status}")
         except Exception as e:
@@ -548,8 +696,20 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
     def on_progress(self, task: DownloadTask):
         """Called when download progress updates"""
         try:
-            # Emit signal for thread-safe UI update
-            self._download_signals.progress_update.emit(task)
+            # Only whole-percent changes are worth crossing into the GUI thread
+            pct = int(task.progress)
+            if pct == task.last_reported_pct:
+                return
+            task.last_reported_pct = pct
+            
+            # Keep only the newest update per task; the first one since the
+            # last flush arms the throttle timer on the GUI thread
+            with self._progress_lock:
+                self._latest_progress[task.task_id] = task
+                schedule = not self._progress_flush_scheduled
+                self._progress_flush_scheduled = True
+            if schedule:
+                self._download_signals.progress_pending.emit()
         except Exception as e:
             print(f"Progress callback error: {e}")
         
@@ -557,7 +717,7 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         """Called when download completes successfully"""
         try:
             # Emit signal for thread-safe UI update
-            self._download_signals.download_complete.emit(task)
+            self._download_signals.update.emit(EVT_COMPLETE, task, None)
         except Exception as e:
             print(f"Complete callback error: {e}")
             
@@ -565,7 +725,7 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         """Called when download encounters an error"""
         try:
             # Emit signal for thread-safe UI update
-            self._download_signals.download_error.emit(task, error)
+            self._download_signals.update.emit(EVT_ERROR, task, error)
         except Exception as e:
             print(f"Error callback error: {e}")
         
@@ -573,7 +733,7 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
         """Called when download status changes"""
         try:
             # Emit signal for thread-safe UI update
-            self._download_signals.status_change.emit(task, old_status.value, new_status.value)
+            self._download_signals.update.emit(EVT_STATUS, task, (old_status.value, new_status.value))
         except Exception as e:
             print(f"Status change callback error: {e}")
         
@@ -582,16 +742,56 @@ class MainWindow(QMainWindow, DownloadProgressCallback):
     def log_status(self, message):
         """Log a status message"""
         try:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            # Simple direct update - the progress timer runs on main thread
-            self.status_text.append(f"[{timestamp}] {message}")
-            self.status_text.ensureCursorVisible()
+            timestamp = self._timestamp()
+            # Queue the line; the flush timer writes the batch in one append
+            self._pending_logs.append(f"[{timestamp}] {message}")
+            if not self._log_flush_timer.isActive():
+                self._log_flush_timer.start()
         except Exception as e:
             print(f"Log status error: {e}")
+            
+    def _timestamp(self) -> str:
+        """Current time as HH:MM:SS, formatted at most once a second"""
+        now = int(time.time())
+        if now != self._timestamp_cache[0]:
+            self._timestamp_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._timestamp_cache[1]
+        
+    @pyqtSlot()
+    def _flush_logs(self):
+        """Write queued status lines to the log"""
+        try:
+            if not self._pending_logs:
+                return
+            if not self.status_text.isVisible() or self.isMinimized():
+                # Nobody can see the log; keep the most recent lines as a
+                # ring buffer and write them once it is shown again
+                del self._pending_logs[:-LOG_MAX_LINES]
+                return
+            # Only the lines that would survive the block limit are written
+            lines, self._pending_logs = self._pending_logs[-LOG_MAX_LINES:], []
+            self.status_text.appendPlainText("\n".join(lines))
+            self.status_text.ensureCursorVisible()
+        except Exception as e:
+            print(f"Log flush error: {e}")
         
+    def showEvent(self, event):
+        """Write log lines buffered while the window was hidden"""
+        super().showEvent(event)
+        if self._pending_logs:
+            self._log_flush_timer.start()
+            
+    def changeEvent(self, event):
+        """Write log lines buffered while the window was minimized"""
+        super().changeEvent(event)
+        if (event.type() == QEvent.Type.WindowStateChange
+                and not self.isMinimized() and self._pending_logs):
+            self._log_flush_timer.start()
+            
     def closeEvent(self, event):
         """Handle application close event"""
+        for task in list(self._crawl_tasks):
+            task.cancel()
         if self.download_manager:
             self.download_manager.cleanup()
         event.accept()
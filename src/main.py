@@ -5,12 +5,14 @@ Main entry point for the Bulk Video Downloader application
 
 import sys
 import os
+import asyncio
+import qasync
 from PyQt6.QtWidgets import QApplication
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from gui.main_window import MainWindow
+from gui.main_window import MainWindow, APP_STYLESHEET
 
 
 def main():
@@ -18,11 +20,22 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Bulk Video Downloader")
     app.setApplicationVersion("1.0.0")
+    app.setStyleSheet(APP_STYLESHEET)
+    
+    # Run asyncio on top of the Qt event loop, so the window can await
+    # network I/O (crawling) without worker threads
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
     
     window = MainWindow()
     window.show()
     
-    sys.exit(app.exec())
+    with loop:
+        exit_code = loop.run_forever()
+        # The window has closed; shut the crawler's HTTP session down on
+        # the loop that opened it, before the loop itself is closed
+        loop.run_until_complete(window.video_crawler.aclose())
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":